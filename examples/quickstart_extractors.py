@@ -81,15 +81,15 @@ def main():
 
     # Analyze missing data patterns
     print("\nMissing Data Analysis:")
-    print(data_statistics['missing_data'])
+    print(data_statistics['missing_data'].round(2))
 
     # Assess data quality metrics
     print("\nData Quality Assessment:")
-    print(data_statistics['data_quality'])
+    print(data_statistics['data_quality'].round(2))
 
     # Display value distribution analysis
     print("\nValue Distribution Analysis:")
-    print(data_statistics['value_counts'])
+    print(data_statistics['value_counts'].round(2))
 
     # Retrieve source metadata using Factory pattern
     print(f"\nData Source Information ({source.value}):")
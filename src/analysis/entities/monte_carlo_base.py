@@ -51,6 +51,8 @@ class MonteCarloBase(ABC):
         - Risk assessment
     """
 
+    BACKENDS = ("cpu", "gpu")
+
     def __init__(
         self,
         portfolio: Portfolio,
@@ -58,6 +60,7 @@ class MonteCarloBase(ABC):
         risk_free_rate: float = 0.0,
         alpha: float = 0.05,
         seed: Optional[int] = None,
+        backend: str = "cpu",
     ):
         """
         Initialize Monte Carlo simulation parameters.
@@ -74,6 +77,10 @@ class MonteCarloBase(ABC):
             Significance level for risk metrics
         seed : int, optional
             Random seed for reproducibility
+        backend : str, default="cpu"
+            Array backend for path generation: "cpu" (NumPy) or "gpu" (CuPy).
+            The GPU backend draws all paths in one batch on the device and
+            requires CuPy with a CUDA device.
             
         Design Notes
         -----------
@@ -94,6 +101,8 @@ class MonteCarloBase(ABC):
         self.n_simulations = n_simulations
         self.risk_free_rate = risk_free_rate
         self.alpha = alpha
+        self.seed = seed
+        self.backend = backend
 
         self.initial_capital = portfolio.total_value_initial()
         self.results: Optional[pd.DataFrame] = None
@@ -117,6 +126,9 @@ class MonteCarloBase(ABC):
         if risk_free_rate < -1:
             raise ValueError(f"Risk-free rate cannot be less than -100%, got {risk_free_rate}")
 
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend must be one of {self.BACKENDS}, got {backend}")
+
     @abstractmethod
     def run(self) -> Any:
         """
@@ -177,6 +189,124 @@ class MonteCarloBase(ABC):
         simulated_log_returns = np.random.multivariate_normal(mean=means, cov=cov, size=n_periods)
         return np.exp(simulated_log_returns) - 1
 
+    def _array_module(self) -> Any:
+        """Return the array module matching the configured backend.
+
+        Returns:
+            module: ``numpy`` for the CPU backend, ``cupy`` for the GPU backend.
+
+        Raises:
+            ImportError: If the GPU backend is selected and CuPy is not installed.
+        """
+        if self.backend == "cpu":
+            return np
+
+        try:
+            import cupy
+        except ImportError as e:
+            raise ImportError("backend='gpu' requires CuPy (pip install cupy-cuda12x)") from e
+        return cupy
+
+    def generate_simulated_returns_batch(self, n_periods: int) -> Any:
+        """Generate multivariate simulated log returns for every simulation at once.
+
+        Standard normal draws are correlated with a factor of the historical
+        covariance matrix, so the whole (n_simulations, n_periods, n_assets)
+        tensor comes from one random call and one batched matrix product.
+        On the GPU backend the result stays on the device.
+
+        Args:
+            n_periods (int): Number of periods to simulate.
+
+        Returns:
+            array: Tensor of simulated simple returns on the configured backend.
+        """
+        xp = self._array_module()
+
+        means = self.historical_returns.mean().to_numpy()
+        eigvals, eigvecs = np.linalg.eigh(self.historical_returns.cov().to_numpy())
+        factor = eigvecs * np.sqrt(np.clip(eigvals, 0, None))
+
+        rng = xp.random.default_rng(self.seed)
+        z = rng.standard_normal((self.n_simulations, n_periods, len(self.assets)))
+        simulated_log_returns = z @ xp.asarray(factor).T + xp.asarray(means)
+        return xp.exp(simulated_log_returns) - 1
+
+    def _store_results(self, weights: np.ndarray, returns: np.ndarray) -> pd.DataFrame:
+        """Expand simulated weights and returns into the long simulation format.
+
+        Args:
+            weights (np.ndarray): Portfolio weights per simulation,
+                shape (n_simulations, n_assets).
+            returns (np.ndarray): Simulated simple returns,
+                shape (n_simulations, n_periods, n_assets).
+
+        Returns:
+            pd.DataFrame: One row per (simulation, asset, date) containing:
+                - Asset: asset name (categorical)
+                - Date: simulation timestamp
+                - Weight: asset weight in the portfolio
+                - Value: asset value evolution
+                - Total Value: total portfolio value
+                - Return: asset return
+                - Simulation: simulation number (categorical)
+        """
+        n_sims, n_periods, n_assets = returns.shape
+
+        xp = self._array_module()
+        weights = xp.asarray(weights)
+        returns = xp.asarray(returns)
+
+        growth = 1 + returns
+        asset_values = self.initial_capital * weights[:, None, :] * xp.cumprod(growth, axis=1)
+        total_values = self.initial_capital * xp.cumprod(
+            xp.einsum("sta,sa->st", growth, weights), axis=1
+        )
+
+        if xp is not np:
+            weights, returns, asset_values, total_values = (
+                xp.asnumpy(a) for a in (weights, returns, asset_values, total_values)
+            )
+
+        # Rows are laid out simulation-major, then asset, then date. Asset and
+        # Simulation only take n_assets / n_simulations distinct values, so they
+        # are stored as dictionary-encoded categoricals instead of full columns.
+        asset_codes = np.tile(np.repeat(np.arange(n_assets), n_periods), n_sims)
+        sim_codes = np.repeat(np.arange(n_sims), n_assets * n_periods)
+
+        self.simulations = pd.DataFrame({
+            "Asset": pd.Categorical.from_codes(asset_codes, categories=self.assets),
+            "Date": np.tile(self.historical_returns.index.values, n_sims * n_assets),
+            "Weight": np.repeat(weights.ravel(), n_periods),
+            "Value": asset_values.transpose(0, 2, 1).ravel(),
+            "Total Value": np.broadcast_to(
+                total_values[:, None, :], (n_sims, n_assets, n_periods)
+            ).ravel(),
+            "Return": returns.transpose(0, 2, 1).ravel(),
+            "Simulation": pd.Categorical.from_codes(
+                sim_codes, categories=pd.RangeIndex(1, n_sims + 1)
+            ),
+        })
+
+        # Aggregated metrics per simulation, computed on the arrays directly
+        flat_returns = returns.reshape(n_sims, -1)
+        self.simulation_metrics = pd.DataFrame(
+            np.round(
+                np.column_stack([
+                    total_values[:, -1],
+                    flat_returns.mean(axis=1),
+                    flat_returns.std(axis=1, ddof=1),
+                ]),
+                4,
+            ),
+            index=pd.RangeIndex(1, n_sims + 1, name="Simulation"),
+            columns=pd.MultiIndex.from_tuples(
+                [("Total Value", "last"), ("Return", "mean"), ("Return", "std")]
+            ),
+        )
+
+        return self.simulations
+
     def get_weights(self) -> pd.DataFrame:
         """Get the current portfolio weights as a DataFrame.
         
@@ -20,6 +20,7 @@ class MonteCarloCombined(MonteCarloBase):
         n_simulations: int = 1000,
         risk_free_rate: float = 0.0,
         seed: int = None,
+        backend: str = "cpu",
     ) -> None:
         """Initialize MonteCarloCombined.
 
@@ -31,12 +32,15 @@ class MonteCarloCombined(MonteCarloBase):
             seed (int): Random seed for reproducibility. Defaults to None.
             weight_method (str): Method to generate stochastic weights.
                 Options: `"dirichlet"` or `"normalized"`. Defaults to `"dirichlet"`.
+            backend (str): Array backend, `"cpu"` (NumPy) or `"gpu"` (CuPy).
+                Defaults to `"cpu"`.
         """
         super().__init__(
             portfolio=portfolio,
             n_simulations=n_simulations,
             risk_free_rate=risk_free_rate,
             seed=seed,
+            backend=backend,
         )
 
     def run(self) -> pd.DataFrame:
@@ -52,57 +56,23 @@ class MonteCarloCombined(MonteCarloBase):
                 - Return: Asset return
                 - Simulation: Simulation number
         """
-        simulations_list = []
+        n_periods = len(self.historical_returns)
+
+        if self.backend == "gpu":
+            # Batched draw on the device; weights stay on the host RNG
+            weights = np.stack([self.generate_weights() for _ in range(self.n_simulations)])
+            returns = self.generate_simulated_returns_batch(n_periods)
+            return self._store_results(weights, returns)
+
+        weights = np.empty((self.n_simulations, len(self.assets)))
+        returns = np.empty((self.n_simulations, n_periods, len(self.assets)))
 
         for sim in range(self.n_simulations):
             # 1. Generate stochastic weights
-            weights = self.generate_weights()
+            weights[sim] = self.generate_weights()
 
             # 2. Generate simulated log returns
-            simulated_returns = self.generate_simulated_returns(len(self.historical_returns))
-
-            # 3. Build DataFrame of simulated returns
-            df_returns = pd.DataFrame(
-                simulated_returns,
-                columns=self.assets,
-                index=self.historical_returns.index,
-            )
-
-            # 4. Compute individual and total portfolio values
-            for asset in self.assets:
-                asset_weight = weights[list(self.assets).index(asset)]
-                asset_returns = df_returns[asset]
-                asset_values = self.initial_capital * asset_weight * (1 + asset_returns).cumprod()
-                total_value = self.initial_capital * (1 + df_returns).dot(weights).cumprod()
-
-                # DataFrame for the current asset
-                df_asset = pd.DataFrame(
-                    {
-                        "Asset": asset,
-                        "Date": df_returns.index,
-                        "Weight": asset_weight,
-                        "Value": asset_values,
-                        "Total Value": total_value,
-                        "Return": asset_returns,
-                        "Simulation": sim + 1,
-                    }
-                )
-
-                simulations_list.append(df_asset)
-
-        # Combine all simulations
-        self.simulations = pd.concat(simulations_list, ignore_index=True)
-
-        # Aggregate metrics per simulation
-        self.simulation_metrics = (
-            self.simulations.groupby("Simulation")
-            .agg(
-                {
-                    "Total Value": lambda x: x.iloc[-1],
-                    "Return": ["mean", "std"],
-                }
-            )
-            .round(4)
-        )
+            returns[sim] = self.generate_simulated_returns(n_periods)
 
-        return self.simulations
+        # 3. Compute individual and total portfolio values
+        return self._store_results(weights, returns)
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional
 
 class MonteCarloCalculator:
     """
@@ -54,6 +54,26 @@ class MonteCarloCalculator:
             raise ValueError("Simulations DataFrame cannot be empty")
             
         self.simulations = simulations
+        self._simulation_returns: Optional[pd.Series] = None
+        self._drawdowns: Optional[Dict[str, float]] = None
+
+    def simulation_returns(self) -> pd.Series:
+        """
+        Mean return of each simulation path.
+
+        The grouped series is computed once and memoized, since basic
+        statistics, VaR/CVaR and the visualizations all start from it.
+
+        Returns
+        -------
+        pd.Series
+            Mean return indexed by simulation number
+        """
+        if self._simulation_returns is None:
+            self._simulation_returns = (
+                self.simulations.groupby('Simulation', observed=True)['Return'].mean()
+            )
+        return self._simulation_returns
         
     def calculate_basic_statistics(self) -> Dict[str, float]:
         """
@@ -83,7 +103,7 @@ class MonteCarloCalculator:
         - Calculates cross-sectional measures
         - Handles outliers appropriately
         """
-        returns = self.simulations.groupby('Simulation')['Return'].mean()
+        returns = self.simulation_returns()
         
         return {
             'mean_return': returns.mean(),
@@ -125,7 +145,7 @@ class MonteCarloCalculator:
         - Computes CVaR as mean of tail events
         - Handles extreme scenarios appropriately
         """
-        returns = self.simulations.groupby('Simulation')['Return'].mean()
+        returns = self.simulation_returns()
         percentile = 100 * (1 - confidence_level)
         var = np.percentile(returns, percentile)
         cvar = returns[returns <= var].mean()
@@ -213,7 +233,8 @@ class MonteCarloCalculator:
         returns_pivot = self.simulations.pivot_table(
             index=['Date', 'Simulation'],
             columns='Asset',
-            values='Return'
+            values='Return',
+            observed=True
         )
         
         return returns_pivot.corr()
@@ -252,15 +273,23 @@ class MonteCarloCalculator:
             3. Compute drawdown percentages
             4. Aggregate statistics
         """
+        if self._drawdowns is not None:
+            return dict(self._drawdowns)
+
         # Extract portfolio values across time and simulations
-        values = self.simulations.groupby(['Date', 'Simulation'])['Total Value'].first().unstack()
+        values = (
+            self.simulations.groupby(['Date', 'Simulation'], observed=True)['Total Value']
+            .first()
+            .unstack()
+        )
         
         # Calculate drawdowns for each simulation path
         running_max = values.expanding().max()
         drawdowns = (values - running_max) / running_max
         
-        return {
+        self._drawdowns = {
             'max_drawdown': drawdowns.min().min(),
             'avg_drawdown': drawdowns.mean().mean(),
             'drawdown_std': drawdowns.std().mean()
-        }
\ No newline at end of file
+        }
+        return dict(self._drawdowns)
\ No newline at end of file
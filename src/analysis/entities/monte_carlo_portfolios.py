@@ -23,6 +23,7 @@ class MonteCarloPortfolio(MonteCarloBase):
         n_simulations: int = 1000,
         risk_free_rate: float = 0.0,
         seed: Optional[int] = None,
+        backend: str = "cpu",
     ):
         """
         Initializes the Monte Carlo Portfolio simulation.
@@ -41,12 +42,15 @@ class MonteCarloPortfolio(MonteCarloBase):
                 Default is "dirichlet".
             seed: int, optional
                 Random seed for reproducibility. Default is None.
+            backend: str, optional
+                Array backend, "cpu" (NumPy) or "gpu" (CuPy). Default is "cpu".
         """
         super().__init__(
             portfolio=portfolio,
             n_simulations=n_simulations,
             risk_free_rate=risk_free_rate,
             seed=seed,
+            backend=backend,
         )
 
     def run(self) -> pd.DataFrame:
@@ -64,47 +68,14 @@ class MonteCarloPortfolio(MonteCarloBase):
                 - Return: asset return
                 - Simulation: simulation number
         """
-        simulation_results = []
+        # 1. Generate random weights for every simulation
+        weights = np.stack([self.generate_weights() for _ in range(self.n_simulations)])
 
-        for sim in range(self.n_simulations):
-            # 1. Generate random weights
-            weights = self.generate_weights()
-
-            # 2. Copy historical returns
-            returns_df = self.historical_returns.copy()
-
-            # 3. Compute values and returns per asset
-            for asset in self.assets:
-                asset_weight = weights[list(self.assets).index(asset)]
-                asset_returns = returns_df[asset]
-
-                asset_values = self.initial_capital * asset_weight * (1 + asset_returns).cumprod()
-                total_value = self.initial_capital * (1 + returns_df).dot(weights).cumprod()
-
-                asset_df = pd.DataFrame({
-                    "Asset": asset,
-                    "Date": returns_df.index,
-                    "Weight": asset_weight,
-                    "Value": asset_values,
-                    "Total Value": total_value,
-                    "Return": asset_returns,
-                    "Simulation": sim + 1,
-                })
-
-                simulation_results.append(asset_df)
-
-        # Consolidate all simulations into one DataFrame
-        self.simulations = pd.concat(simulation_results, ignore_index=True)
-
-        # Compute aggregate metrics by simulation
-        self.simulation_metrics = (
-            self.simulations
-            .groupby("Simulation")
-            .agg({
-                "Total Value": lambda x: x.iloc[-1],
-                "Return": ["mean", "std"],
-            })
-            .round(4)
+        # 2. Reuse the real historical returns in every simulation
+        returns = np.broadcast_to(
+            self.historical_returns.to_numpy(),
+            (self.n_simulations,) + self.historical_returns.shape,
         )
 
-        return self.simulations
+        # 3. Compute values and returns per asset
+        return self._store_results(weights, returns)
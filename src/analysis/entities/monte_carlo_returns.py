@@ -22,6 +22,7 @@ class MonteCarloReturn(MonteCarloBase):
         n_simulations: int = 1000,
         risk_free_rate: float = 0.0,
         seed: Optional[int] = None,
+        backend: str = "cpu",
     ):
         """
         Initializes the Monte Carlo Return simulation.
@@ -37,12 +38,15 @@ class MonteCarloReturn(MonteCarloBase):
                 Initial invested capital. Default is 10,000.
             seed: int, optional
                 Random seed for reproducibility. Default is None.
+            backend: str, optional
+                Array backend, "cpu" (NumPy) or "gpu" (CuPy). Default is "cpu".
         """
         super().__init__(
             portfolio=portfolio,
             n_simulations=n_simulations,
             risk_free_rate=risk_free_rate,
             seed=seed,
+            backend=backend,
         )
 
     def run(self) -> pd.DataFrame:
@@ -60,53 +64,18 @@ class MonteCarloReturn(MonteCarloBase):
                 - Return: asset return
                 - Simulation: simulation number
         """
-        means = self.historical_returns.mean()
-        cov = self.historical_returns.cov()
-        simulation_results = []
+        n_periods = len(self.historical_returns)
 
-        for sim in range(self.n_simulations):
-            # Generate simulated log returns
-            simulated_returns = self.generate_simulated_returns(len(self.historical_returns))
+        # Generate simulated log returns for every simulation
+        if self.backend == "gpu":
+            returns = self.generate_simulated_returns_batch(n_periods)
+        else:
+            returns = np.stack([
+                self.generate_simulated_returns(n_periods)
+                for _ in range(self.n_simulations)
+            ])
 
-            # Create DataFrame of simulated returns
-            returns_df = pd.DataFrame(
-                simulated_returns,
-                columns=self.assets,
-                index=self.historical_returns.index,
-            )
+        # Weights stay fixed across simulations
+        weights = np.tile(self.weights, (self.n_simulations, 1))
 
-            # Compute asset and portfolio value evolution
-            for asset in self.assets:
-                asset_weight = self.weights[list(self.assets).index(asset)]
-                asset_returns = returns_df[asset]
-
-                asset_values = self.initial_capital * asset_weight * (1 + asset_returns).cumprod()
-                total_value = self.initial_capital * (1 + returns_df).dot(self.weights).cumprod()
-
-                asset_df = pd.DataFrame({
-                    "Asset": asset,
-                    "Date": returns_df.index,
-                    "Weight": asset_weight,
-                    "Value": asset_values,
-                    "Total Value": total_value,
-                    "Return": asset_returns,
-                    "Simulation": sim + 1,
-                })
-
-                simulation_results.append(asset_df)
-
-        # Combine all simulations into one DataFrame
-        self.simulations = pd.concat(simulation_results, ignore_index=True)
-
-        # Compute aggregated metrics per simulation
-        self.simulation_metrics = (
-            self.simulations
-            .groupby("Simulation")
-            .agg({
-                "Total Value": lambda x: x.iloc[-1],
-                "Return": ["mean", "std"],
-            })
-            .round(4)
-        )
-
-        return self.simulations
+        return self._store_results(weights, returns)
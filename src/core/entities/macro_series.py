@@ -3,11 +3,259 @@ Module for representing and analyzing macroeconomic time series data.
 Implements the Strategy pattern for data extraction and the Observer pattern for statistics updates.
 """
 
+import sys
+import warnings
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Union, Optional
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union, Optional
+import numpy as np
 import pandas as pd
 from src.core.entities.time_series import TimeSeries
-from src.extractor.macro_extractor import MacroExtractor
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional (extra "fast"), _stats_numpy is used instead
+    NUMBA_AVAILABLE = False
+
+STAT_NAMES = ("mean", "std", "min", "max", "total_change", "avg_annual_change")
+
+
+def _stats_numpy(values: np.ndarray) -> np.ndarray:
+    """
+    Compute every series statistic with NaN-aware NumPy reductions.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Float64 array of shape (n_periods, n_series)
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(STAT_NAMES), n_series), NaN for empty series
+    """
+    n_rows, n_cols = values.shape
+    cols = np.arange(n_cols)
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=0)
+
+    first = values[valid.argmax(axis=0), cols]
+    last = values[n_rows - 1 - valid[::-1].argmax(axis=0), cols]
+
+    # Compare each observation with the previous valid one (forward-filled row
+    # index), so gaps behave like pct_change on the dropped series
+    prev_rows = np.maximum.accumulate(
+        np.where(valid[:-1], np.arange(n_rows - 1)[:, None], 0), axis=0
+    )
+
+    # Empty or single-observation series legitimately reduce to NaN
+    with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        ratios = np.divide(values[1:], values[prev_rows, cols])
+        ratios -= 1
+        pct_change = np.nanmean(ratios, axis=0)
+        stats = np.vstack([
+            np.nanmean(values, axis=0),
+            np.nanstd(values, axis=0, ddof=1),
+            np.nanmin(values, axis=0),
+            np.nanmax(values, axis=0),
+            np.where(count > 1, last / first - 1, 0.0),
+            np.where(count > 1, pct_change * count, 0.0),
+        ])
+
+    stats[:, count == 0] = np.nan
+    return stats
+
+if NUMBA_AVAILABLE:
+    # fastmath is deliberately off: it lets LLVM assume no NaNs, which would
+    # drop the isnan checks that implement dropna semantics
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _stats_kernel(values: np.ndarray) -> np.ndarray:
+        """
+        Compute every series statistic in one NaN-skipping sweep per column.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Float64 array of shape (n_periods, n_series)
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (len(STAT_NAMES), n_series), NaN for empty series
+        """
+        n_rows, n_cols = values.shape
+        out = np.full((6, n_cols), np.nan)
+
+        for j in prange(n_cols):
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+            lo = np.inf
+            hi = -np.inf
+            first = np.nan
+            prev = np.nan
+            ratio_sum = 0.0
+            n_ratios = 0
+
+            for i in range(n_rows):
+                x = values[i, j]
+                if np.isnan(x):
+                    continue
+                n += 1
+                delta = x - mean
+                mean += delta / n
+                m2 += delta * (x - mean)
+                lo = min(lo, x)
+                hi = max(hi, x)
+                if n == 1:
+                    first = x
+                else:
+                    ratio = x / prev - 1
+                    if not np.isnan(ratio):
+                        ratio_sum += ratio
+                        n_ratios += 1
+                prev = x
+
+            if n == 0:
+                continue
+            out[0, j] = mean
+            out[2, j] = lo
+            out[3, j] = hi
+            if n > 1:
+                out[1, j] = np.sqrt(m2 / (n - 1))
+                out[4, j] = prev / first - 1
+                if n_ratios > 0:
+                    out[5, j] = ratio_sum / n_ratios * n
+            else:
+                out[4, j] = 0.0
+                out[5, j] = 0.0
+
+        return out
+
+    @lru_cache(maxsize=1)
+    def _kernel_matches_numpy() -> bool:
+        """
+        Check once per process that _stats_kernel reproduces _stats_numpy.
+
+        Both run on a small panel covering gaps, a leading NaN, a zero
+        denominator, a single observation and an empty series. On any
+        mismatch a warning is issued and the NumPy path is used instead.
+
+        Returns
+        -------
+        bool
+            Whether the compiled kernel may be used
+        """
+        values = np.array([
+            [1.0, np.nan, np.nan, 2.0, 0.0],
+            [2.0, 3.0, np.nan, np.nan, 1.0],
+            [np.nan, np.nan, np.nan, 4.0, 3.0],
+            [1.5, np.nan, np.nan, 8.0, np.nan],
+            [3.0, np.nan, np.nan, 6.0, 2.0],
+        ])
+        expected = _stats_numpy(values)
+        matches = np.allclose(_stats_kernel(np.asfortranarray(values)), expected, equal_nan=True)
+        if not matches:
+            warnings.warn(
+                "Numba statistics kernel disagrees with NumPy; using the NumPy implementation",
+                RuntimeWarning
+            )
+        return matches
+
+
+# Complete extractions keyed by (indicators, countries, start_date, end_date),
+# least recently used first
+_EXTRACT_CACHE: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_EXTRACT_CACHE_SIZE = 128
+
+
+def _extract(
+    indicators: Tuple[str, ...],
+    countries: Tuple[str, ...],
+    start_date: date,
+    end_date: date,
+    use_cache: bool = True,
+    failures: Optional[List[Tuple[str, str]]] = None
+) -> pd.DataFrame:
+    """
+    Extract macroeconomic data through MacroExtractor.
+
+    Parameters
+    ----------
+    indicators : Tuple[str, ...]
+        Indicator codes, in the order the columns should be returned
+    countries : Tuple[str, ...]
+        Country codes, in the order the columns should be returned
+    start_date : date
+        Beginning of the extraction period
+    end_date : date
+        End of the extraction period
+    use_cache : bool, default=True
+        Whether the extractor may serve the request from its on-disk cache
+    failures : List[Tuple[str, str]], optional
+        Collects the (indicator, country) pairs lost to HTTP errors
+
+    Returns
+    -------
+    pd.DataFrame
+        Extracted data
+    """
+    # Imported here so loading the entity does not pull in the HTTP client stack
+    from src.extractor.macro_extractor import MacroExtractor
+
+    return MacroExtractor(use_cache=use_cache).extract(
+        indicators=list(indicators),
+        countries=list(countries),
+        start_date=start_date,
+        end_date=end_date,
+        failures=failures
+    )
+
+def _cached_extract(
+    indicators: Tuple[str, ...],
+    countries: Tuple[str, ...],
+    start_date: date,
+    end_date: date
+) -> pd.DataFrame:
+    """
+    Extract macroeconomic data, memoized on the request parameters.
+
+    Only complete panels are kept: a request that lost series to HTTP
+    errors is fetched again next time.
+
+    Parameters
+    ----------
+    indicators : Tuple[str, ...]
+        Indicator codes, in the order the columns should be returned
+    countries : Tuple[str, ...]
+        Country codes, in the order the columns should be returned
+    start_date : date
+        Beginning of the extraction period
+    end_date : date
+        End of the extraction period
+
+    Returns
+    -------
+    pd.DataFrame
+        Extracted data; shared between cache hits, so callers must copy it
+    """
+    request = (indicators, countries, start_date, end_date)
+    data = _EXTRACT_CACHE.get(request)
+    if data is not None:
+        _EXTRACT_CACHE.move_to_end(request)
+        return data
+
+    failures = []
+    data = _extract(*request, failures=failures)
+    if not failures:
+        _EXTRACT_CACHE[request] = data
+        if len(_EXTRACT_CACHE) > _EXTRACT_CACHE_SIZE:
+            _EXTRACT_CACHE.popitem(last=False)
+    return data
 
 @dataclass
 class MacroSeries(TimeSeries):
@@ -24,8 +272,13 @@ class MacroSeries(TimeSeries):
         Economic indicators to track (e.g., 'GDP', 'CPI', 'UNEMPLOYMENT')
     countries : Union[str, List[str]]
         Countries to analyze, default ['ESP', 'EUU']
-    stats : Dict[str, Dict[str, float]]
-        Statistical metrics for each indicator and country
+    use_cache : bool
+        Reuse data already extracted for the same request, in memory and
+        on disk, default True
+    stats_df : pd.DataFrame
+        Statistical metrics, one row per (indicator, country) series
+    stats : Dict[str, Dict[str, Dict[str, float]]]
+        Nested dict view of ``stats_df``, built on access
         
     Design Patterns
     --------------
@@ -36,7 +289,9 @@ class MacroSeries(TimeSeries):
     
     indicators: Union[str, List[str]] = field(default_factory=list)
     countries: Union[str, List[str]] = field(default_factory=lambda: ["ESP", "EUU"])
-    stats: Dict[str, Dict[str, float]] = field(default_factory=dict, init=False)
+    use_cache: bool = True
+    stats_df: pd.DataFrame = field(default_factory=pd.DataFrame, init=False)
+    _indicators: pd.Index = field(default_factory=lambda: pd.Index([]), init=False, repr=False)
     
     def __post_init__(self) -> None:
         """
@@ -53,15 +308,23 @@ class MacroSeries(TimeSeries):
         if isinstance(self.countries, str):
             self.countries = self.countries.replace(",", " ").split()
             
-        extractor = MacroExtractor()
-        self.data = extractor.extract(
-            indicators=self.indicators,
-            countries=self.countries,
-            start_date=self.start_date,
-            end_date=self.end_date
-        )
+        request = (tuple(self.indicators), tuple(self.countries), self.start_date, self.end_date)
+        if self.use_cache:
+            self.data = _cached_extract(*request).copy()
+        else:
+            self.data = _extract(*request, use_cache=False)
         
         self._compute_stats()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drop every extraction memoized in memory by previous instances.
+
+        The on-disk cache of MacroExtractor is kept; build a series with
+        ``use_cache=False`` to bypass it as well.
+        """
+        _EXTRACT_CACHE.clear()
         
     def _compute_stats(self) -> None:
         """
@@ -75,37 +338,46 @@ class MacroSeries(TimeSeries):
         - Average Annual Change: Annualized rate of change
         
         This method implements the Observer pattern by automatically
-        updating statistics when called after data changes.
+        updating statistics when called after data changes. It also refreshes
+        the cached top-level column labels shared by the query methods.
         """
+        self._indicators = self.data.columns.unique(level=0)
+
         if self.data.empty:
-            self.stats = {}
+            self.stats_df = pd.DataFrame(columns=STAT_NAMES)
             return
             
-        self.stats = {}
-        
-        for indicator in self.data.columns.get_level_values(0).unique():
-            indicator_data = self.data[indicator]
-            country_stats = {}
-            for country in indicator_data.columns:
-                series = indicator_data[country].dropna()
-                
-                if not series.empty:
-                    total_change = (series.iloc[-1] / series.iloc[0] - 1) if len(series) > 1 else 0
-                    avg_change = (
-                        (series.pct_change().mean() * len(series))
-                        if len(series) > 1 else 0
-                    )
-                    
-                    country_stats[country] = {
-                        "mean": float(series.mean()),
-                        "std": float(series.std()),
-                        "min": float(series.min()),
-                        "max": float(series.max()),
-                        "total_change": float(total_change),
-                        "avg_annual_change": float(avg_change)
-                    }
-                    
-            self.stats[indicator] = country_stats
+        # Work on the underlying array once; NaNs are skipped per series,
+        # matching the former per-series dropna() semantics
+        values = self.data.to_numpy(dtype=np.float64)
+        if NUMBA_AVAILABLE and _kernel_matches_numpy():
+            stats = _stats_kernel(np.asfortranarray(values))
+        else:
+            stats = _stats_numpy(values)
+
+        has_data = ~np.isnan(values).all(axis=0)
+        self.stats_df = pd.DataFrame(
+            stats.T[has_data],
+            index=self.data.columns[has_data],
+            columns=STAT_NAMES
+        )
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Statistics as nested dicts keyed by indicator, then country.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Dict[str, float]]]
+            Metric values per series; indicators without data map to ``{}``
+        """
+        stats = {indicator: {} for indicator in self._indicators}
+        # A single tolist() converts every value to a Python float at once
+        rows = self.stats_df.to_numpy().tolist()
+        for (indicator, country), row in zip(self.stats_df.index, rows):
+            stats[indicator][country] = dict(zip(STAT_NAMES, row))
+        return stats
     
     def get_latest_values(self) -> pd.DataFrame:
         """
@@ -123,11 +395,7 @@ class MacroSeries(TimeSeries):
         if self.data.empty:
             return pd.DataFrame()
             
-        latest = {}
-        for indicator in self.data.columns.get_level_values(0).unique():
-            latest[indicator] = self.data[indicator].iloc[-1]
-            
-        return pd.DataFrame(latest)
+        return self._split_by_indicator(self.data.iloc[-1])
     
     def get_changes(
         self,
@@ -156,25 +424,30 @@ class MacroSeries(TimeSeries):
         if self.data.empty:
             return pd.DataFrame()
             
-        changes = {}
-        for indicator in self.data.columns.get_level_values(0).unique():
-            indicator_data = self.data[indicator]
-            
-            if periods:
-                start_values = indicator_data.iloc[-periods-1]
-                end_values = indicator_data.iloc[-1]
-            else:
-                start_values = indicator_data.iloc[0]
-                end_values = indicator_data.iloc[-1]
-                
-            total_change = (end_values / start_values - 1)
-            
-            if annualized and periods:
-                changes[indicator] = (1 + total_change) ** (1 / (periods/12)) - 1
-            else:
-                changes[indicator] = total_change
+        # Read both endpoint rows once for every indicator and country
+        endpoints = self.data.iloc[[-periods-1 if periods else 0, -1]].to_numpy()
+        total_change = pd.Series(endpoints[1] / endpoints[0] - 1, index=self.data.columns)
+        
+        if annualized and periods:
+            total_change = (1 + total_change) ** (1 / (periods/12)) - 1
                 
-        return pd.DataFrame(changes)
+        return self._split_by_indicator(total_change)
+    
+    def _split_by_indicator(self, row: pd.Series) -> pd.DataFrame:
+        """
+        Reshape a row indexed by the data columns into one column per indicator.
+
+        Parameters
+        ----------
+        row : pd.Series
+            Values indexed by the two-level column MultiIndex of ``self.data``
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with indicators as columns and countries as index
+        """
+        return pd.DataFrame({indicator: row[indicator] for indicator in self._indicators})
     
     def get_correlations(self) -> Dict[str, pd.DataFrame]:
         """
@@ -192,9 +465,37 @@ class MacroSeries(TimeSeries):
         if self.data.empty:
             return {}
             
+        # Lay the data out as (period, indicator, country) so every matrix comes
+        # from the same batched products; missing pairs become NaN columns
+        inner = self.data.columns.unique(level=1)
+        full = self.data.reindex(columns=pd.MultiIndex.from_product([self._indicators, inner]))
+        values = full.to_numpy(dtype=np.float64).reshape(
+            len(full), len(self._indicators), len(inner)
+        )
+
+        # Pairwise-complete sums reproduce DataFrame.corr() NaN handling;
+        # centering first keeps the one-pass covariance numerically stable
+        valid = ~np.isnan(values)
+        mask = valid.astype(np.float64)
+        with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            centered = np.where(valid, values - np.nanmean(values, axis=0), 0.0)
+
+            n_obs = np.einsum("tic,tid->icd", mask, mask)
+            sum_x = np.einsum("tic,tid->icd", centered, mask)
+            sum_xx = np.einsum("tic,tid->icd", centered ** 2, mask)
+            sum_xy = np.einsum("tic,tid->icd", centered, centered)
+            sum_y = sum_x.transpose(0, 2, 1)
+            sum_yy = sum_xx.transpose(0, 2, 1)
+
+            cov = sum_xy - sum_x * sum_y / n_obs
+            corr = cov / np.sqrt((sum_xx - sum_x ** 2 / n_obs) * (sum_yy - sum_y ** 2 / n_obs))
+
         correlations = {}
-        for indicator in self.data.columns.get_level_values(0).unique():
-            correlations[indicator] = self.data[indicator].corr()
+        for i, indicator in enumerate(self._indicators):
+            columns = self.data[indicator].columns
+            corr_df = pd.DataFrame(corr[i], index=inner, columns=inner)
+            correlations[indicator] = corr_df.loc[columns, columns]
             
         return correlations
     
@@ -206,14 +507,11 @@ class MacroSeries(TimeSeries):
         including key statistics and changes for each indicator and country.
         Implements the Template Method pattern for consistent data presentation.
         """
-        print(f"=== Statistics for {self.name} ===")
-        
-        for indicator, country_stats in self.stats.items():
-            print(f"\nIndicator: {indicator}")
-            for country, stats in country_stats.items():
-                print(f"\n{country}:")
-                for stat, value in stats.items():
-                    if "change" in stat:
-                        print(f"  {stat}: {value:.2%}")
-                    else:
-                        print(f"  {stat}: {value:.4f}")
\ No newline at end of file
+        formatters = {
+            stat: "{:.2%}".format if "change" in stat else "{:.4f}".format
+            for stat in STAT_NAMES
+        }
+        sys.stdout.write(
+            f"=== Statistics for {self.name} ===\n"
+            f"{self.stats_df.to_string(formatters=formatters)}\n"
+        )
\ No newline at end of file
@@ -6,9 +6,11 @@ This module provides a robust framework for creating and managing investment por
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, List, Union
-from datetime import date, timedelta
+from datetime import date
 from src.core.entities.price_series import PriceSeries
+from src.core.entities.time_series import DEFAULT_LOOKBACK
 from src.extractor.sources.prices.extractor_prices_base import (
     Interval,
     DataSource
@@ -49,22 +51,26 @@ class Portfolio:
     Internal Attributes
     -----------------
     series : PriceSeries
-        Price data container implementing the Strategy pattern
+        Price data container implementing the Strategy pattern, fetched lazily
+        on first access
     positions : Dict[str, float]
         Mapping of holdings to their quantities
+    _held_qty : np.ndarray
+        Quantities aligned with the price data symbols
     """
 
     name: str
     quantity: Union[float, List[float]]
     holdings: Union[str, List[str]] = field(default_factory=list)
-    start_date: date = field(default_factory=lambda: date.today() - timedelta(days=30))
+    start_date: date = field(default_factory=lambda: date.today() - DEFAULT_LOOKBACK)
     end_date: date = field(default_factory=date.today)
     source: DataSource = field(default_factory=DataSource.YAHOO)
     interval: Interval = field(default_factory=Interval.DAILY)
 
     # Internal state implementing Observer pattern
-    series: PriceSeries = field(default_factory=dict, init=False)
     positions: Dict[str, float] = field(init=False)
+    _qty_arr: np.ndarray = field(init=False, repr=False)
+    _weights: Dict[str, float] = field(init=False, repr=False)
 
     def __post_init__(self):
         """
@@ -73,8 +79,9 @@ class Portfolio:
         This method implements the Template Method pattern by:
         1. Normalizing input parameters
         2. Validating portfolio configuration
-        3. Setting up price data strategy
-        4. Initializing position tracking
+        3. Initializing position tracking
+
+        Price data is not requested here; see ``series``.
         
         Raises
         ------
@@ -87,28 +94,70 @@ class Portfolio:
         else:
             holdings = list(self.holdings)
         
-        if isinstance(self.quantity, (int, float)):
-            quantities = [float(self.quantity)] * len(holdings)
+        if isinstance(self.quantity, (int, float, np.number)):
+            quantities = np.full(len(holdings), self.quantity, dtype=np.float64)
         else:
-            quantities = [float(q) for q in self.quantity]
+            quantities = np.asarray(self.quantity, dtype=np.float64).reshape(-1)
         
-        if len(quantities) != len(holdings):
+        if quantities.shape[0] != len(holdings):
             raise ValueError("Number of quantities must match number of holdings.")
 
-        if any(q < 0 for q in quantities):
+        if (quantities < 0).any():
             raise ValueError("Quantities must be non-negative.")
 
-        self.positions = dict(zip(holdings, quantities))
-        
-        self.series = PriceSeries(
+        self.positions = dict(zip(holdings, quantities.tolist()))
+
+        # Weights only depend on the positions, so they are computed once;
+        # repeated holdings collapse in positions, so reuse the array only if none
+        if len(self.positions) == len(holdings):
+            self._qty_arr = quantities
+        else:
+            self._qty_arr = np.fromiter(
+                self.positions.values(), dtype=np.float64, count=len(self.positions)
+            )
+        total = self._qty_arr.sum()
+        weights = self._qty_arr / total if total else np.zeros_like(self._qty_arr)
+        self._weights = dict(zip(self.positions, weights.tolist()))
+
+    @cached_property
+    def series(self) -> PriceSeries:
+        """
+        Price data for the holdings, fetched on first access.
+
+        Deferring the fetch keeps construction free of network I/O for
+        callers that only need positions or weights.
+
+        Returns
+        -------
+        PriceSeries
+            Price data container for every holding
+        """
+        return PriceSeries(
             name=self.name,
-            symbols=holdings,
+            symbols=list(self.positions),
             start_date=self.start_date,
             end_date=self.end_date,
             source=self.source,
             interval=self.interval
         )
 
+    @cached_property
+    def _held_qty(self) -> np.ndarray:
+        """
+        Quantities aligned with the price data symbols.
+
+        Aligned once so valuations are a plain element-wise product on the
+        underlying arrays.
+
+        Returns
+        -------
+        np.ndarray
+            Quantity per price column, NaN for symbols without a position
+        """
+        return pd.Series(self.positions, dtype=np.float64).reindex(
+            self.series.get_market_value().index
+        ).to_numpy()
+
     def get_prices(self) -> pd.DataFrame:
         """
         Retrieve historical price data for all holdings.
@@ -125,22 +174,18 @@ class Portfolio:
 
     def weights(self) -> Dict[str, float]:
         """
-        Calculate current portfolio weights based on position sizes.
+        Retrieve current portfolio weights based on position sizes.
         
         This method implements the Strategy pattern for weight calculation,
-        handling edge cases such as zero total value.
+        handling edge cases such as zero total value. Weights are computed
+        once at initialization; callers receive a copy of the cached mapping.
 
         Returns
         -------
         Dict[str, float]
             Mapping of holdings to their weights in the portfolio
         """
-        quantities = list(self.positions.values())
-        total = sum(quantities)
-        
-        if total == 0:
-            return {k: 0.0 for k in self.positions.keys()}
-        return {k: q / total for k, q in self.positions.items()}
+        return dict(self._weights)
     
     def total_value_per_holding(self) -> pd.Series:
         """
@@ -155,9 +200,8 @@ class Portfolio:
             Market values indexed by holding symbols
         """
         latest = self.series.get_market_value()
-        qty = pd.Series(self.positions)
 
-        return latest.mul(qty)
+        return pd.Series(latest.to_numpy() * self._held_qty, index=latest.index)
 
     def total_value(self) -> float:
         """
@@ -171,7 +215,9 @@ class Portfolio:
         float
             Total portfolio market value
         """
-        return float(self.total_value_per_holding().sum())
+        latest = self.series.get_market_value().to_numpy()
+
+        return float(np.nansum(latest * self._held_qty))
     
     def total_value_initial(self) -> float:
         """
@@ -185,10 +231,9 @@ class Portfolio:
         float
             Initial portfolio market value
         """
-        initial = self.series.get_initial_prices()
-        qty = pd.Series(self.positions)
+        initial = self.series.get_initial_prices().to_numpy()
 
-        return float(initial.mul(qty).sum())
+        return float(np.nansum(initial * self._held_qty))
 
     def returns(self) -> pd.DataFrame:
         """
@@ -3,10 +3,12 @@ Module for managing and analyzing financial price time series data.
 Implements multiple design patterns for robust price data handling and analysis.
 """
 
+import sys
+import warnings
 from dataclasses import dataclass, field
-from typing import List, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 from src.core.entities.time_series import TimeSeries
-from src.extractor.prices_extractor import MarketDataExtractor
 import pandas as pd
 import numpy as np
 from src.extractor.sources.prices.extractor_prices_base import (
@@ -14,6 +16,108 @@ from src.extractor.sources.prices.extractor_prices_base import (
     DataSource
 )
 
+if TYPE_CHECKING:
+    from src.extractor.prices_extractor import MarketDataExtractor
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional (extra "fast"), the NumPy reductions are used instead
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # fastmath is deliberately off: it lets LLVM assume no NaNs, which would
+    # drop the isnan check that skips incomplete periods
+    @njit(cache=True, error_model="numpy")
+    def _return_mean_std(prices: np.ndarray) -> Tuple[float, float]:
+        """
+        Mean and sample standard deviation of simple returns in one pass.
+
+        Uses Welford's algorithm over the period-over-period returns, skipping
+        periods where either price is missing.
+
+        Parameters
+        ----------
+        prices : np.ndarray
+            Float64 close prices of a single symbol
+
+        Returns
+        -------
+        Tuple[float, float]
+            Mean return and its standard deviation (ddof=1), NaN when undefined
+        """
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(1, prices.shape[0]):
+            r = prices[i] / prices[i - 1] - 1.0
+            if np.isnan(r):
+                continue
+            n += 1
+            delta = r - mean
+            mean += delta / n
+            m2 += delta * (r - mean)
+
+        if n == 0:
+            return np.nan, np.nan
+        if n == 1:
+            return mean, np.nan
+        return mean, np.sqrt(m2 / (n - 1))
+
+    @lru_cache(maxsize=1)
+    def _kernel_matches_numpy() -> bool:
+        """
+        Check once per process that _return_mean_std matches NumPy reductions.
+
+        Both run on price paths covering a gap, a single return and no
+        return at all. On any mismatch a warning is issued and the NumPy
+        path is used instead.
+
+        Returns
+        -------
+        bool
+            Whether the compiled kernel may be used
+        """
+        paths = (
+            np.array([10.0, 11.0, np.nan, 12.0, 12.5, 11.0]),
+            np.array([10.0, 11.0]),
+            np.array([np.nan, 5.0]),
+        )
+        matches = True
+        with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            for prices in paths:
+                returns = prices[1:] / prices[:-1] - 1.0
+                returns = returns[~np.isnan(returns)]
+                expected = (returns.mean(), returns.std(ddof=1))
+                matches &= np.allclose(_return_mean_std(prices), expected, equal_nan=True)
+        if not matches:
+            warnings.warn(
+                "Numba return kernel disagrees with NumPy; using the NumPy implementation",
+                RuntimeWarning
+            )
+        return bool(matches)
+
+
+@lru_cache(maxsize=1)
+def _market_data_extractor() -> "MarketDataExtractor":
+    """
+    Shared market data extractor used by every PriceSeries.
+
+    The extractor keeps the client of every data source it has used, so it
+    is created once and reused instead of per series.
+
+    Returns
+    -------
+    MarketDataExtractor
+        Process-wide extractor instance
+    """
+    # Imported here so loading the entity does not pull in every data vendor client
+    from src.extractor.prices_extractor import MarketDataExtractor
+
+    return MarketDataExtractor()
+
+
 @dataclass
 class PriceSeries(TimeSeries):
     """
@@ -43,6 +147,8 @@ class PriceSeries(TimeSeries):
     
     symbols: Union[str, List[str]] = field(default_factory=list)
     stats: pd.DataFrame = field(default_factory=pd.DataFrame, init=False)
+    _close: Optional[pd.DataFrame] = field(default=None, init=False, repr=False)
+    _returns: Optional[pd.DataFrame] = field(default=None, init=False, repr=False)
     source: DataSource = field(default_factory=DataSource.YAHOO)
     interval: Interval = field(default_factory=Interval.DAILY)
     
@@ -61,8 +167,7 @@ class PriceSeries(TimeSeries):
         if isinstance(self.symbols, str):
             self.symbols = self.symbols.replace(",", " ").split()
 
-        extractor = MarketDataExtractor()
-        self.data = extractor.fetch_price_series(
+        self.data = _market_data_extractor().fetch_price_series(
             symbols=self.symbols,
             start_date=self.start_date,
             end_date=self.end_date,
@@ -82,11 +187,17 @@ class PriceSeries(TimeSeries):
         - Volatility: Standard deviation of returns
         - Annualized Metrics: Both return and volatility
         
+        It also refreshes the cached close-price frame (one column per symbol)
+        and the returns frame shared by the price and return accessors.
+        
         Raises
         ------
         ValueError
             If the data structure doesn't match expected format
         """
+        self._close = None
+        self._returns = None
+
         if self.data.empty:
             self.stats = {}
             return
@@ -95,27 +206,39 @@ class PriceSeries(TimeSeries):
             raise ValueError("Data must have a MultiIndex with (Price, Symbol) levels")
 
         try:
-            close_prices = self.data.xs('Close', axis=1, level=0)
+            self._close = self.data['Close']
         except KeyError:
             self.stats = {}
             return
 
-        returns = close_prices.pct_change(fill_method=None).dropna()
+        # Simple returns on the raw price matrix; like pct_change().dropna(),
+        # any period with a missing value in some symbol is discarded
+        prices = self._close.to_numpy(dtype=np.float64)
+        use_kernel = NUMBA_AVAILABLE and prices.shape[1] == 1 and _kernel_matches_numpy()
+        with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            returns = prices[1:] / prices[:-1] - 1.0
+            complete = ~np.isnan(returns).any(axis=1)
+            returns = returns[complete]
 
-        means = returns.mean()
-        stds = returns.std()
+            if use_kernel:
+                # Single symbol: one compiled sweep instead of two reductions
+                mean, std = _return_mean_std(prices[:, 0])
+                means, stds = np.array([mean]), np.array([std])
+            else:
+                means = returns.mean(axis=0)
+                stds = returns.std(axis=0, ddof=1)
 
-        self.stats = {
-            symbol: {
-                "mean_return": float(means[symbol]),
-                "volatility": float(stds[symbol]),
-                "annual_return": float((1 + means[symbol]) ** 252 - 1),
-                "annual_volatility": float(stds[symbol] * np.sqrt(252)),
-            }
-            for symbol in returns.columns
-        }
-
-        self.stats = pd.DataFrame(self.stats)
+        self.stats = pd.DataFrame(
+            np.vstack([means, stds, np.expm1(252.0 * np.log1p(means)), stds * np.sqrt(252.0)]),
+            index=["mean_return", "volatility", "annual_return", "annual_volatility"],
+            columns=self._close.columns.rename(None),
+        )
+        self._returns = pd.DataFrame(
+            returns,
+            index=self._close.index[1:][complete],
+            columns=self._close.columns
+        )
 
     def get_market_value(self) -> pd.Series:
         """
@@ -129,14 +252,10 @@ class PriceSeries(TimeSeries):
         pd.Series
             Latest closing prices for each symbol, indexed by symbol name
         """
-        if self.data.empty:
+        if self._close is None:
             return pd.Series(dtype=float)
 
-        try:
-            close_prices = self.data.xs('Close', axis=1, level=0)
-            return close_prices.iloc[-1]
-        except KeyError:
-            return pd.Series(dtype=float)
+        return self._close.iloc[-1]
 
     def get_initial_prices(self) -> pd.Series:
         """
@@ -150,14 +269,10 @@ class PriceSeries(TimeSeries):
         pd.Series
             Initial closing prices for each symbol, indexed by symbol name
         """
-        if self.data.empty:
+        if self._close is None:
             return pd.Series(dtype=float)
 
-        try:
-            close_prices = self.data.xs('Close', axis=1, level=0)
-            return close_prices.iloc[0]
-        except KeyError:
-            return pd.Series(dtype=float)
+        return self._close.iloc[0]
 
     def get_returns(self) -> pd.DataFrame:
         """
@@ -176,12 +291,77 @@ class PriceSeries(TimeSeries):
         pd.DataFrame
             Historical returns for each symbol, with dates as index
         """
-        try:
-            close_prices = self.data.xs('Close', axis=1, level=0)
-            return close_prices.pct_change(fill_method=None).dropna()
-        except KeyError:
+        if self._returns is None:
             return pd.DataFrame()
 
+        # Copy so callers cannot alter the cached returns used by the stats
+        return self._returns.copy()
+
+    def rolling_stats(self, window: int) -> pd.DataFrame:
+        """
+        Compute mean return and volatility over a rolling window.
+        
+        Window sums come from cumulative sums of the returns, so the cost is
+        linear in the number of periods regardless of the window length. The
+        returns are centered on the mean of their finite values first to keep
+        the sum-of-squares difference numerically stable. Windows containing
+        a non-finite return (e.g. after a zero close) are NaN; the others are
+        unaffected.
+
+        Parameters
+        ----------
+        window : int
+            Number of return periods per window (at least 2)
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per complete window, indexed by its last date, with
+            (statistic, symbol) columns for mean_return and volatility
+
+        Raises
+        ------
+        ValueError
+            If window is smaller than 2
+        """
+        if window < 2:
+            raise ValueError(f"Window must be at least 2, got {window}")
+
+        if self._returns is None or len(self._returns) < window:
+            return pd.DataFrame()
+
+        returns = self._returns.to_numpy()
+
+        # A non-finite return would poison every later cumulative sum, so it
+        # is zeroed here and only the windows containing it are masked
+        finite = np.isfinite(returns)
+        n_finite = finite.sum(axis=0)
+        returns = np.where(finite, returns, 0.0)
+        offset = returns.sum(axis=0) / np.maximum(n_finite, 1)
+        centered = returns - offset
+
+        zeros = np.zeros((1, returns.shape[1]))
+        sums = np.concatenate([zeros, np.cumsum(centered, axis=0)])
+        squares = np.concatenate([zeros, np.cumsum(centered * centered, axis=0)])
+        window_sum = sums[window:] - sums[:-window]
+        window_sq = squares[window:] - squares[:-window]
+
+        means = window_sum / window
+        variances = np.clip((window_sq - window_sum * means) / (window - 1), 0.0, None)
+
+        if not finite.all():
+            invalid = np.concatenate([zeros, np.cumsum(~finite, axis=0)])
+            has_invalid = (invalid[window:] - invalid[:-window]) > 0
+            means[has_invalid] = np.nan
+            variances[has_invalid] = np.nan
+
+        symbols = self._returns.columns.rename(None)
+        return pd.DataFrame(
+            np.hstack([means + offset, np.sqrt(variances)]),
+            index=self._returns.index[window - 1:],
+            columns=pd.MultiIndex.from_product([["mean_return", "volatility"], symbols]),
+        )
+
     def describe(self) -> None:
         """
         Generate detailed statistical summary for all symbols.
@@ -192,11 +372,14 @@ class PriceSeries(TimeSeries):
         - Volatility measures with appropriate precision
         - Clear per-symbol breakdowns
         """
-        print(f"\n=== Statistics for {self.name or 'Price Series'} ===")
+        lines = [f"\n=== Statistics for {self.name or 'Price Series'} ==="]
         for symbol, stats in self.stats.items():
-            print(f"\nStats for {symbol}:")
+            lines.append(f"\nStats for {symbol}:")
             for stat_name, value in stats.items():
                 if 'return' in stat_name:
-                    print(f"  {stat_name}: {value:.2%}")
+                    lines.append(f"  {stat_name}: {value:.2%}")
                 else:
-                    print(f"  {stat_name}: {value:.4f}")
+                    lines.append(f"  {stat_name}: {value:.4f}")
+
+        # Written in one call instead of one print per line
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -3,11 +3,16 @@ Module for generic financial time series analysis and management.
 Implements various design patterns for flexible and extensible time series handling.
 """
 
+import time
 from typing import Dict, Any
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
+import numpy as np
 import pandas as pd
 
+# Analysis period used when no start date is given
+DEFAULT_LOOKBACK = timedelta(days=30)
+
 @dataclass
 class TimeSeries:
     """
@@ -46,7 +51,7 @@ class TimeSeries:
 
     name: str
     data: pd.DataFrame = field(default_factory=pd.DataFrame)
-    start_date: date = field(default_factory=lambda: date.today() - timedelta(days=30))
+    start_date: date = field(default_factory=lambda: date.today() - DEFAULT_LOOKBACK)
     end_date: date = field(default_factory=date.today)
     metadata: Dict[str, Any] = field(default_factory=dict, init=False)
 
@@ -57,13 +62,20 @@ class TimeSeries:
         This method implements the Observer pattern by automatically
         updating metadata when the time series is created or modified.
         It tracks:
-        - Creation timestamp (UTC)
+        - Creation timestamp (UTC, nanoseconds since the epoch)
         - Data source information
         - Data quality metrics
         """
-        self.metadata["created_at"] = datetime.utcnow()
+        self.metadata["created_at"] = time.time_ns()
         self.metadata["source"] = self.source
-        self.metadata["missing_ratio"] = self.data.isna().mean().mean()
+
+        # One pass over the backing array; no per-column intermediate Series
+        if self.data.empty:
+            self.metadata["missing_ratio"] = 0.0
+        else:
+            values = self.data.to_numpy()
+            missing = np.isnan(values) if values.dtype.kind == "f" else pd.isna(values)
+            self.metadata["missing_ratio"] = np.count_nonzero(missing) / missing.size
 
     def summary(self) -> None:
         """
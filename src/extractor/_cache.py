@@ -0,0 +1,144 @@
+"""
+On-disk cache for extracted data.
+
+Vendor APIs are slow and rate limited, while most requests (historical
+prices, annual macro indicators) return the same data when repeated. This
+module stores extracted DataFrames as Parquet files named after a hash of
+the request, so repeated requests are served from disk.
+
+Design Patterns:
+    - Proxy: Sits in front of the extractors and answers repeated requests
+    - Memento: Persists extraction results between runs
+
+Key Features:
+    - Content-addressed entries keyed by the request parameters
+    - Time-to-live based on file modification time
+    - Atomic writes so readers never see partial files
+    - Degrades to a no-op when Parquet support (pyarrow) is unavailable
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "cache"
+
+
+class FileCache:
+    """
+    Parquet-backed cache of DataFrames keyed by request parameters.
+
+    Attributes
+    ----------
+    directory : Path
+        Directory holding the cache entries
+    ttl : timedelta
+        Maximum age of an entry before it is treated as missing
+
+    Examples
+    --------
+    >>> cache = FileCache("worldbank", ttl=timedelta(days=7))
+    >>> key = cache.key(("NY.GDP.MKTP.CD",), ("ESP",), "2010-01-01", "2020-12-31")
+    >>> data = cache.get(key)
+    >>> if data is None:
+    ...     data = fetch()
+    ...     cache.set(key, data)
+    """
+
+    def __init__(self, namespace: str, ttl: timedelta):
+        """
+        Initialize a cache stored under ``CACHE_DIR / namespace``.
+
+        Parameters
+        ----------
+        namespace : str
+            Subdirectory separating entries of different extractors
+        ttl : timedelta
+            Maximum age of an entry before it is treated as missing
+        """
+        self.directory = CACHE_DIR / namespace
+        self.ttl = ttl
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        Build a cache key from the request parameters.
+
+        Parameters
+        ----------
+        *parts : Any
+            Request parameters; their ``repr`` must be stable across runs
+
+        Returns
+        -------
+        str
+            Hex digest identifying the request
+        """
+        return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.parquet"
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Return the cached data for a key, if present and fresh.
+
+        Parameters
+        ----------
+        key : str
+            Key returned by ``key``
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            Cached data, or None on a miss, an expired entry or a read error
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl.total_seconds():
+                return None
+            return pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        # pyarrow's ArrowInvalid, ArrowTypeError and ArrowNotImplementedError
+        # derive from ValueError, TypeError and NotImplementedError
+        except (ImportError, ValueError, TypeError, NotImplementedError, OSError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path.name}: {str(e)}")
+            return None
+
+    def set(self, key: str, data: pd.DataFrame) -> None:
+        """
+        Store data under a key.
+
+        The frame is written to a temporary file and moved into place, so a
+        concurrent reader sees either the old entry or the new one. Failures
+        are logged and otherwise ignored: the cache is an optimization.
+
+        Parameters
+        ----------
+        key : str
+            Key returned by ``key``
+        data : pd.DataFrame
+            Data to store
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+            os.replace(tmp_path, path)
+        except (ImportError, ValueError, TypeError, NotImplementedError, OSError) as e:
+            logger.debug(f"Could not write cache entry {path.name}: {str(e)}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
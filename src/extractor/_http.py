@@ -0,0 +1,40 @@
+"""
+Shared HTTP session for the data source extractors.
+
+Calling ``requests.get`` opens a new connection, and with it a new TCP and
+TLS handshake, for every request. The extractors instead share one
+``requests.Session`` whose connection pool keeps connections to each API
+host alive between requests.
+
+Design Patterns:
+    - Singleton: One session per process, created on first use
+    - Flyweight: Pooled connections are reused across extractors
+"""
+
+import atexit
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Enough pooled connections per host for the concurrent per-symbol fetches
+POOL_SIZE = 16
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session, creating it on first use.
+
+    Returns
+    -------
+    requests.Session
+        Session with a pooled adapter mounted for HTTP and HTTPS; it is
+        closed when the interpreter exits
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
@@ -19,10 +19,11 @@ Key Features:
     - Comprehensive error handling
 """
 
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 import pandas as pd
 
+from src.extractor._cache import FileCache
 from src.extractor.sources.macro.extractor_worldbank import WorldBankExtractor
 
 class MacroExtractor:
@@ -41,10 +42,19 @@ class MacroExtractor:
         
     Attributes
     ----------
-    AVAILABLE_SOURCES : List[str]
-        List of registered data sources available for extraction
-    _extractors : dict
+    AVAILABLE_SOURCES : FrozenSet[str]
+        Registered data sources available for extraction, derived from the
+        registry so validation and dispatch cannot disagree
+    CACHE_TTL : timedelta
+        How long extracted data is reused from the on-disk cache
+    _extractors : Dict[str, type]
         Registry of extractor classes mapped to source names
+    _instances : Dict[str, WorldBankExtractor]
+        Extractor instances, created on first use and reused afterwards
+    _cache : Optional[FileCache]
+        On-disk cache of extracted data, None when caching is disabled
+    _default_countries : List[str]
+        Countries extracted when a request does not name any
         
     Examples
     --------
@@ -56,15 +66,25 @@ class MacroExtractor:
     ... )
     """
     
-    AVAILABLE_SOURCES = ['worldbank']
+    _extractors = {
+        'worldbank': WorldBankExtractor
+    }
+    AVAILABLE_SOURCES = frozenset(_extractors)
+    CACHE_TTL = timedelta(days=7)
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         """
         Initialize the macroeconomic data extractor.
         
-        This constructor implements the Registry and Factory patterns by
-        setting up a dictionary of available extractors. Each extractor
-        is mapped to its corresponding source identifier.
+        This constructor implements the Registry and Factory patterns on
+        top of the class-level dictionary of available extractors, where
+        each extractor is mapped to its corresponding source identifier.
+        
+        Parameters
+        ----------
+        use_cache : bool, default=True
+            Reuse data extracted by earlier identical requests, stored on
+            disk for CACHE_TTL
         
         Design Pattern Implementation:
             - Registry: Maintains mapping of sources to extractors
@@ -74,22 +94,52 @@ class MacroExtractor:
         The initialization process:
             1. Sets up extractor registry
             2. Maps source identifiers to extractor classes
-            3. Prepares factory system for extractor creation
+            3. Prepares factory system for extractor creation; instances
+               are only built when a source is first used
             
         Note:
             Currently supports World Bank data source, but the architecture
             is designed for easy addition of new sources.
         """
-        self._extractors = {
-            'worldbank': WorldBankExtractor
-        }
+        self._instances: Dict[str, WorldBankExtractor] = {}
+        self._cache = FileCache('worldbank', ttl=self.CACHE_TTL) if use_cache else None
+        self._default_countries = WorldBankExtractor.DEFAULT_COUNTRIES
+    
+    def _get_extractor(self, source: str = 'worldbank') -> WorldBankExtractor:
+        """
+        Return the extractor for a source, creating it on first use.
+        
+        Parameters
+        ----------
+        source : str, default='worldbank'
+            Registered source identifier
+            
+        Returns
+        -------
+        WorldBankExtractor
+            Extractor instance shared by later calls on this facade
+            
+        Raises
+        ------
+        ValueError
+            If the source is not registered
+        """
+        extractor = self._instances.get(source)
+        if extractor is None:
+            if source not in self.AVAILABLE_SOURCES:
+                raise ValueError(
+                    f"Invalid source '{source}'. Must be one of: {sorted(self.AVAILABLE_SOURCES)}"
+                )
+            extractor = self._instances[source] = self._extractors[source]()
+        return extractor
     
     def extract(
         self,
         indicators: List[str],
         countries: Optional[List[str]] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        failures: Optional[List[Tuple[str, str]]] = None
     ) -> pd.DataFrame:
         """
         Extract macroeconomic data from the configured source.
@@ -105,9 +155,9 @@ class MacroExtractor:
             
         Process Flow:
             1. Validate and prepare input parameters
-            2. Create appropriate extractor instance
+            2. Return cached data for an identical recent request, if any
             3. Execute data extraction
-            4. Format and return results
+            4. Format, cache and return results
         
         Parameters
         ----------
@@ -122,6 +172,9 @@ class MacroExtractor:
         end_date : str, optional
             End date in YYYY-MM-DD format
             Defaults to current date
+        failures : List[Tuple[str, str]], optional
+            If given, every (indicator, country) pair that could not be
+            fetched because of an HTTP error is appended to it
 
         Returns
         -------
@@ -151,17 +204,34 @@ class MacroExtractor:
         ... )
         """
 
-        countries = countries or WorldBankExtractor.DEFAULT_COUNTRIES
+        countries = countries or self._default_countries
         start_date = start_date or "1990-01-01"
         end_date = end_date or datetime.now().strftime("%Y-%m-%d")
         
-        extractor = self._extractors['worldbank']
-        data = extractor.get_macro_data(
+        # Only requests ending before the current year are cached; later
+        # ones may still receive new or revised annual values
+        key = None
+        if self._cache is not None and pd.Timestamp(end_date).year < datetime.now().year:
+            key = FileCache.key(tuple(indicators), tuple(countries), start_date, end_date)
+            data = self._cache.get(key)
+            if data is not None:
+                return data
+
+        fetch_failures = []
+        data = self._get_extractor().get_macro_data(
             indicators=indicators,
             countries=countries,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            failures=fetch_failures
         )
+        if failures is not None:
+            failures.extend(fetch_failures)
+
+        # A panel missing series because of HTTP errors is not cached, so
+        # the next request retries them
+        if key is not None and not fetch_failures:
+            self._cache.set(key, data)
         
         return data
     
@@ -201,4 +271,4 @@ class MacroExtractor:
         extractor's documentation for details.
         """
             
-        return self._extractors['worldbank'].list_available_indicators()
\ No newline at end of file
+        return self._get_extractor().list_available_indicators()
\ No newline at end of file
@@ -3,9 +3,14 @@ Financial data extraction module that coordinates multiple data sources.
 Implements Factory pattern for creating extractors and Facade pattern for simplified API.
 """
 
-from typing import List, Dict, Union
-from datetime import datetime
+import warnings
+from typing import List, Dict, Type, Union
+from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
+from src.extractor._cache import FileCache
 from src.extractor.sources.prices.extractor_yahoo import YahooExtractor
 from src.extractor.sources.prices.extractor_eodhd import EODHDExtractor
 from src.extractor.sources.prices.extractor_fmp import FMPExtractor
@@ -16,6 +21,51 @@ from src.extractor.sources.prices.extractor_prices_base import (
     DataSource
 )
 
+# Identifiers of the supported data sources, in declaration order
+_SOURCE_NAMES = tuple(source.value for source in DataSource)
+
+# Price types every extractor must return, in reporting order, and the same
+# names as a set for membership tests
+_OHLC = ('Open', 'High', 'Low', 'Close')
+_OHLCV = _OHLC + ('Volume',)
+_REQUIRED_PRICE_TYPES = frozenset(_OHLCV)
+
+
+def _invalid_price_mask(
+    open_: Union[pd.Series, pd.DataFrame],
+    high: Union[pd.Series, pd.DataFrame],
+    low: Union[pd.Series, pd.DataFrame],
+    close: Union[pd.Series, pd.DataFrame]
+) -> np.ndarray:
+    """
+    Flag periods whose OHLC prices are mutually inconsistent.
+    
+    A period is invalid when the high is below the low, or the open or
+    close lies outside the [low, high] range. The comparisons are written
+    into one result array through a single scratch buffer, instead of
+    allocating a temporary array for every comparison and every OR.
+    
+    Parameters
+    ----------
+    open_, high, low, close : Union[pd.Series, pd.DataFrame]
+        Prices of each type with identical shape and column order
+        
+    Returns
+    -------
+    np.ndarray
+        Boolean array of the same shape, True where prices are invalid;
+        comparisons involving NaN are never invalid
+    """
+    o, h, l, c = (prices.to_numpy() for prices in (open_, high, low, close))
+    invalid = np.less(h, l)
+    scratch = np.empty_like(invalid)
+    for a, b in ((c, l), (o, l)):
+        invalid |= np.less(a, b, out=scratch)
+    for a, b in ((c, h), (o, h)):
+        invalid |= np.greater(a, b, out=scratch)
+    return invalid
+
+
 class MarketDataExtractor:
     """
     A comprehensive facade for extracting and processing financial market data.
@@ -37,9 +87,12 @@ class MarketDataExtractor:
         - Data validation and cleaning
         - Quality metrics computation
         - Missing data and outlier handling
+        - On-disk cache of completed historical requests
     """
     
-    def __init__(self):
+    CACHE_TTL = timedelta(days=7)
+    
+    def __init__(self, use_cache: bool = True):
         """
         Initialize the market data extractor with all available data sources.
         
@@ -52,22 +105,59 @@ class MarketDataExtractor:
             - Strategy: Prepares multiple extraction strategies
             - Facade: Initializes unified interface
             
+        Parameters
+        ----------
+        use_cache : bool, default=True
+            Reuse validated data of earlier identical requests whose period
+            has already closed, stored on disk for CACHE_TTL
+            
         The initialization process:
             1. Creates extractor registry
-            2. Instantiates all available source extractors
-            3. Maps data sources to their extractors
-            4. Sets up the facade interface
+            2. Maps data sources to their extractor classes
+            3. Sets up the facade interface
         
         Note:
-            Automatically handles API configuration for all sources
-            and maintains singleton instances of extractors.
+            Extractors are instantiated on first use of their source, so
+            API configuration and client setup are only paid for the
+            sources actually used; each instance is then reused.
         """
-        self._extractors: Dict[DataSource, BaseExtractor] = {
-            DataSource.YAHOO: YahooExtractor(),
-            DataSource.EODHD: EODHDExtractor(),
-            DataSource.FMP: FMPExtractor(),
-            DataSource.ALPHA_VANTAGE: AlphaVantageExtractor()
+        self._extractors: Dict[DataSource, Type[BaseExtractor]] = {
+            DataSource.YAHOO: YahooExtractor,
+            DataSource.EODHD: EODHDExtractor,
+            DataSource.FMP: FMPExtractor,
+            DataSource.ALPHA_VANTAGE: AlphaVantageExtractor
         }
+        self._instances: Dict[DataSource, BaseExtractor] = {}
+        self._cache = FileCache('prices', ttl=self.CACHE_TTL) if use_cache else None
+
+    def _get_extractor(self, source: DataSource) -> BaseExtractor:
+        """
+        Return the extractor for a source, creating it on first use.
+        
+        Parameters
+        ----------
+        source : DataSource
+            Enumerated data source identifier
+            
+        Returns
+        -------
+        BaseExtractor
+            Extractor instance shared by later calls on this facade
+            
+        Raises
+        ------
+        ValueError
+            If the specified source is not available
+        """
+        try:
+            extractor_cls = self._extractors[source]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid source. Must be one of: {list(_SOURCE_NAMES)}") from None
+
+        extractor = self._instances.get(source)
+        if extractor is None:
+            extractor = self._instances[source] = extractor_cls()
+        return extractor
     
     def fetch_price_series(
         self,
@@ -93,9 +183,10 @@ class MarketDataExtractor:
         Process Flow:
             1. Validate input parameters
             2. Select appropriate extractor
-            3. Execute data extraction
-            4. Validate and clean results
-            5. Return standardized data
+            3. Return cached data for an identical past request, if any
+            4. Execute data extraction
+            5. Validate and clean results
+            6. Cache and return standardized data
         
         Parameters
         ----------
@@ -140,12 +231,24 @@ class MarketDataExtractor:
         ... )
         >>> print(data.head())
         """
-        if not isinstance(source, DataSource):
-            raise ValueError(
-                f"Invalid source. Must be one of: {[s.value for s in DataSource]}"
+        extractor = self._get_extractor(source)
+        
+        # Only periods that ended before today are cached; later ones may
+        # still receive new or revised prices
+        key = None
+        period_closed = pd.Timestamp(end_date).normalize() < pd.Timestamp.today().normalize()
+        if self._cache is not None and period_closed:
+            key = FileCache.key(
+                source.value,
+                symbols if isinstance(symbols, str) else tuple(symbols),
+                pd.Timestamp(start_date).isoformat(),
+                pd.Timestamp(end_date).isoformat(),
+                interval.value
             )
+            data = self._cache.get(key)
+            if data is not None:
+                return data
         
-        extractor = self._extractors[source]
         data = extractor.extract_data(
             symbols=symbols,
             start_date=start_date,
@@ -153,43 +256,71 @@ class MarketDataExtractor:
             interval=interval.value
         )
 
+        self._validate_price_data(data)
+        
+        if key is not None:
+            self._cache.set(key, data)
+        
+        return data
+        
+    def _validate_price_data(self, data: pd.DataFrame) -> None:
+        """
+        Validate the structure and contents of extracted price data.
+        
+        Checks run from cheapest to most expensive, so malformed data fails
+        before any per-value comparison: column structure, required price
+        types, dtypes, and finally the OHLC relationships of every ticker at
+        once. Inconsistent prices are reported with a warning, not rejected.
+        
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Extracted data with (Price, Ticker) MultiIndex columns
+            
+        Raises
+        ------
+        ValueError
+            If the columns are not a two-level MultiIndex or a required
+            price type is missing
+        TypeError
+            If a required price column is not numeric
+        """
         # Validate DataFrame structure
         if not isinstance(data.columns, pd.MultiIndex):
             raise ValueError("Data must have a MultiIndex with (Price, Ticker) levels")
             
-        if len(data.columns.levels) != 2:
+        if data.columns.nlevels != 2:
             raise ValueError("MultiIndex must have exactly 2 levels: Price and Ticker")
             
         # Validate required price types
-        required_columns = {'Open', 'High', 'Low', 'Close', 'Volume'}
         price_types = set(data.columns.get_level_values(0).unique())
-        missing = required_columns - price_types
+        missing = _REQUIRED_PRICE_TYPES - price_types
         if missing:
-            raise ValueError(f"Missing required price types: {missing}")
-            
-        # Validate data types for each ticker
-        for ticker in data.columns.get_level_values(1).unique():
-            # Validate numeric columns for each price type
-            for price_type in required_columns:
-                if not pd.api.types.is_numeric_dtype(data[price_type, ticker]):
-                    raise TypeError(f"{price_type} must be numeric type for ticker {ticker}")
-                    
-            # Validate price consistency for each ticker
-            ticker_data = data.xs(ticker, axis=1, level=1)
-            invalid_prices = ticker_data[
-                (ticker_data['High'] < ticker_data['Low']) |
-                (ticker_data['Close'] < ticker_data['Low']) |
-                (ticker_data['Close'] > ticker_data['High']) |
-                (ticker_data['Open'] < ticker_data['Low']) |
-                (ticker_data['Open'] > ticker_data['High'])
-            ]
+            raise ValueError(f"Missing required price types: {set(missing)}")
             
-            if not invalid_prices.empty:
-                f"Invalid price relationships found for {ticker} at dates: "
-                f"{invalid_prices.index.strftime('%Y-%m-%d').tolist()}"
-                  
-        return data
-        
+        # Validate data types: one dtype selection over the column blocks
+        for price_type, ticker in data.select_dtypes(exclude=['number', 'bool']).columns:
+            if price_type in _REQUIRED_PRICE_TYPES:
+                raise TypeError(f"{price_type} must be numeric type for ticker {ticker}")
+
+        # Validate price consistency for every ticker at once: one frame per
+        # price type, with the tickers of the low prices in the same order
+        low = data.xs('Low', axis=1, level=0)
+        tickers = low.columns
+        open_, high, close = (
+            data.xs(price_type, axis=1, level=0)[tickers]
+            for price_type in ('Open', 'High', 'Close')
+        )
+        invalid = _invalid_price_mask(open_, high, low, close)
+
+        if invalid.any():
+            for j in np.flatnonzero(invalid.any(axis=0)):
+                dates = data.index[invalid[:, j]]
+                warnings.warn(
+                    f"Invalid price relationships found for {tickers[j]} at dates: "
+                    f"{dates.strftime('%Y-%m-%d').tolist()}"
+                )
+
     def compute_data_statistics(self, data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
         Compute comprehensive statistics and data quality metrics for price data.
@@ -255,91 +386,101 @@ class MarketDataExtractor:
         -----
         The analysis adapts to both single-symbol and multi-symbol datasets,
         providing appropriate metrics for each case.
+        
+        Percentages are returned at full precision; round them when
+        displaying, e.g. ``stats['missing_data'].round(2)``.
         """
         analysis = {}
         
         # Basic Statistics
         analysis['basic_stats'] = data.describe(include='all').transpose()
         
-        # Missing Data
+        # Missing Data; the null mask and its column sums are computed once
+        # and shared with the completeness metric below
+        n_rows = len(data)
+        null_mask = data.isnull()
+        missing_count = null_mask.sum()
         missing_data = pd.DataFrame({
-            'missing_count': data.isnull().sum(),
-            'missing_percentage': round(data.isnull().sum() / len(data) * 100,2),
-            'total_rows': len(data),
-            'complete_rows': len(data.dropna())
+            'missing_count': missing_count,
+            'missing_percentage': missing_count / n_rows * 100,
+            'total_rows': n_rows,
+            'complete_rows': n_rows - int(null_mask.to_numpy().any(axis=1).sum())
         })
         analysis['missing_data'] = missing_data
         
         # Value Counts
+        unique_values = data.nunique()
         value_counts = pd.DataFrame({
-            'unique_values': data.nunique(),
-            'unique_percentage': round(data.nunique() / len(data) * 100,2)
+            'unique_values': unique_values,
+            'unique_percentage': unique_values / n_rows * 100
         })
         analysis['value_counts'] = value_counts
         
         # Quality Metrics
         quality_metrics = pd.DataFrame(index=data.columns)
-        quality_metrics['completeness'] = (1 - data.isnull().mean()) * 100
+        quality_metrics['completeness'] = (1 - missing_count / n_rows) * 100
 
-        def check_column_type_consistency(column):
-            if len(column) == 0:
-                return True
-            
-            column_type = column.dtype
-            non_null_values = column.dropna()
-            
-            if len(non_null_values) == 0:
-                return True
-            try:
-                pd.Series(non_null_values).astype(column_type)
-                return True
-            except (ValueError, TypeError):
-                return False
-        
-        quality_metrics['consistent_types'] = data.apply(check_column_type_consistency)
-        
-        for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
-            col_exists = any(col in level for level in data.columns.levels) if isinstance(data.columns, pd.MultiIndex) else col in data.columns
-            if col_exists:
-                if isinstance(data.columns, pd.MultiIndex):
-                    target_cols = [c for c in data.columns if col in c]
-                else:
-                    target_cols = [col]
-                
-                has_negatives = False
-                for target_col in target_cols:
-                    if data[target_col].dtype in ['int64', 'float64']:
-                        if (data[target_col] < 0).any():
-                            has_negatives = True
-                            break
-                
-                quality_metrics.loc[col, 'has_negatives'] = has_negatives if target_cols else None
-        
-        if all(col in data.columns for col in ['High', 'Low', 'Open', 'Close']):
-            invalid_prices = (
-                (data['High'] < data['Low']) |
-                (data['Close'] < data['Low']) |
-                (data['Close'] > data['High']) |
-                (data['Open'] < data['Low']) |
-                (data['Open'] > data['High'])
-            )
-            quality_metrics.loc['price_relationships', 'invalid_count'] = invalid_prices.sum()
-            quality_metrics.loc['price_relationships', 'invalid_percentage'] = round(
-                invalid_prices.sum() / len(data) * 100,2
+        # A column holds a single dtype by construction, so only object
+        # columns can mix value types; they are the only ones inspected
+        consistent_types = pd.Series(True, index=data.columns)
+        objects = data.select_dtypes(include='object')
+        if objects.shape[1]:
+            consistent_types.loc[objects.columns] = objects.apply(
+                lambda column: column.dropna().map(type).nunique() <= 1
+            ).to_numpy()
+        quality_metrics['consistent_types'] = consistent_types
+        
+        # Negative values are found in one pass over the numeric columns and
+        # then grouped by price type, the first level of the column labels
+        numeric = data.select_dtypes(include=['int64', 'float64'])
+        negative = (numeric < 0).any().to_numpy()
+        numeric_types = numeric.columns.get_level_values(0)
+        price_types = set(data.columns.get_level_values(0))
+        
+        for col in _OHLCV:
+            if col in price_types:
+                has_negatives = negative[numeric_types == col].any()
+                quality_metrics.loc[col, 'has_negatives'] = bool(has_negatives)
+        
+        if all(col in data.columns for col in _OHLC):
+            if isinstance(data.columns, pd.MultiIndex):
+                # A period is invalid when the prices of any symbol are inconsistent
+                low = data['Low']
+                open_, high, close = (
+                    data[price_type][low.columns] for price_type in ('Open', 'High', 'Close')
+                )
+                invalid_prices = _invalid_price_mask(open_, high, low, close).any(axis=1)
+            else:
+                invalid_prices = _invalid_price_mask(
+                    data['Open'], data['High'], data['Low'], data['Close']
+                )
+            invalid_count = int(invalid_prices.sum())
+            quality_metrics.loc['price_relationships', 'invalid_count'] = invalid_count
+            quality_metrics.loc['price_relationships', 'invalid_percentage'] = (
+                invalid_count / len(data) * 100
             )
         
-        if isinstance(data.index, pd.DatetimeIndex):
+        # Frequency inference needs at least three timestamps
+        if isinstance(data.index, pd.DatetimeIndex) and len(data.index) >= 3:
             expected_freq = pd.infer_freq(data.index)
             if expected_freq:
-                ideal_index = pd.date_range(
-                    start=data.index.min(),
-                    end=data.index.max(),
-                    freq=expected_freq
-                )
-                gaps = ideal_index.difference(data.index)
-                quality_metrics.loc['time_series', 'gaps_count'] = len(gaps)
-                quality_metrics.loc['time_series', 'gaps_percentage'] = round(
-                    len(gaps) / len(ideal_index) * 100,2
+                offset = to_offset(expected_freq)
+                if isinstance(offset, Tick):
+                    # Fixed-length steps: the size of the ideal grid follows
+                    # from the span, without building it
+                    ideal_count = (data.index.max() - data.index.min()) // pd.Timedelta(offset) + 1
+                    gaps_count = ideal_count - data.index.nunique()
+                else:
+                    ideal_index = pd.date_range(
+                        start=data.index.min(),
+                        end=data.index.max(),
+                        freq=offset
+                    )
+                    ideal_count = len(ideal_index)
+                    gaps_count = len(ideal_index.difference(data.index))
+                quality_metrics.loc['time_series', 'gaps_count'] = gaps_count
+                quality_metrics.loc['time_series', 'gaps_percentage'] = (
+                    gaps_count / ideal_count * 100
                 )
         
         analysis['data_quality'] = quality_metrics
@@ -375,33 +516,34 @@ class MarketDataExtractor:
         if df.empty:
             raise ValueError(f"No data available")
         
-        required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-        missing_cols = [col for col in required_cols if col not in df.columns.levels[0]]
+        price_types = set(df.columns.get_level_values(0))
+        missing_cols = [col for col in _OHLCV if col not in price_types]
 
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
             
-        df = df.sort_index()
-        df = df[~df.index.duplicated(keep='first')]
+        # Provider output is usually sorted and unique already; rows to drop
+        # are collected in one mask and the frame is copied once at the end
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        keep = np.ones(len(df), dtype=bool)
+        if not df.index.is_unique:
+            keep &= ~df.index.duplicated(keep='first')
         
         if isinstance(df.columns, pd.MultiIndex):
-            invalid_mask = pd.DataFrame(False, index=df.index, columns=df.columns.levels[1].unique())
-            
-            for symbol in df.columns.levels[1].unique():
-                try:
-                    invalid_prices = (
-                        (df[('High', symbol)] < df[('Low', symbol)]) |
-                        (df[('Close', symbol)] < df[('Low', symbol)]) |
-                        (df[('Close', symbol)] > df[('High', symbol)]) |
-                        (df[('Open', symbol)] < df[('Low', symbol)]) |
-                        (df[('Open', symbol)] > df[('High', symbol)])
-                    )
-                    invalid_mask[symbol] = invalid_prices
-                except KeyError:
-                    continue 
+            # One frame per price type with a column per symbol; symbols
+            # missing any of the four prices are not checked
+            fields = [df.xs(price_type, axis=1, level=0) for price_type in _OHLC]
+            symbols = fields[0].columns
+            for field in fields[1:]:
+                symbols = symbols.intersection(field.columns, sort=False)
+            open_, high, low, close = (field[symbols] for field in fields)
+
+            invalid_mask = _invalid_price_mask(open_, high, low, close)
             
-            valid_rows = ~invalid_mask.any(axis=1)
-            df = df.loc[valid_rows]
+            keep &= ~invalid_mask.any(axis=1)
+        
+        df = df.loc[keep]
         
         df['Volume'] = df['Volume'].fillna(0).astype(int)
         
@@ -456,13 +598,25 @@ class MarketDataExtractor:
         -----
         The choice of method can significantly impact analysis results.
         Consider the nature of your data when selecting a strategy.
+        
+        Data without missing values is returned as is, not copied.
         """
+        # Nothing to fill or drop; skip the copy every strategy would make
+        if not data.isnull().to_numpy().any():
+            return data
+        
         if method == 'ffill':
             return data.ffill()
         elif method == 'bfill':
             return data.bfill()
         elif method == 'linear':
-            return data.interpolate(method='linear')
+            # Only numeric columns can be interpolated; others pass through
+            numeric = data.select_dtypes('number')
+            if numeric.shape[1] == data.shape[1]:
+                return data.interpolate(method='linear')
+            filled = data.copy()
+            filled[numeric.columns] = numeric.interpolate(method='linear')
+            return filled
         elif method == 'drop':
             return data.dropna()
         else:
@@ -533,31 +687,45 @@ class MarketDataExtractor:
         if method == 'none':
             return data
             
-        clean_data = data.copy()
-        
-        for column in data.select_dtypes(include=['float64', 'int64']).columns:
+        # Outliers are flagged for all numeric columns at once on a float
+        # matrix; NaNs are ignored by the statistics and never flagged
+        numeric = data.select_dtypes(include=['float64', 'int64'])
+        values = numeric.to_numpy(dtype=np.float64)
+        mask = np.zeros(values.shape, dtype=bool)
+        
+        with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+            warnings.simplefilter('ignore', category=RuntimeWarning)
             if method == 'zscore':
-                z_scores = abs((data[column] - data[column].mean()) / data[column].std())
+                z_scores = np.abs(
+                    (values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0, ddof=1)
+                )
                 mask = z_scores > threshold
-                clean_data.loc[mask, column] = None
                 
-            elif method == 'iqe':
-                Q1 = data[column].quantile(0.25)
-                Q3 = data[column].quantile(0.75)
+            elif method == 'iqr':
+                Q1, Q3 = np.nanpercentile(values, [25, 75], axis=0)
                 IQR = Q3 - Q1
                 lower_bound = Q1 - threshold * IQR
                 upper_bound = Q3 + threshold * IQR
-                mask = (data[column] < lower_bound) | (data[column] > upper_bound)
-                clean_data.loc[mask, column] = None
-                
-        clean_data = clean_data.ffill().bfill()
+                mask = (values < lower_bound) | (values > upper_bound)
+        
+        # The input is only copied when some value has to be blanked; after
+        # that first allocation the frame is owned here and filled in place
+        flagged = np.flatnonzero(mask.any(axis=0))
+        if flagged.size:
+            clean_data = data.copy()
+            for j in flagged:
+                clean_data.loc[mask[:, j], numeric.columns[j]] = None
+            clean_data.ffill(inplace=True)
+        else:
+            clean_data = data.ffill()
+        clean_data.bfill(inplace=True)
         
         return clean_data
     
     @property
     def available_sources(self) -> List[str]:
         """List all available data sources."""
-        return [source.value for source in DataSource]
+        return list(_SOURCE_NAMES)
     
     def get_source_info(self, source: DataSource) -> Dict:
         """
@@ -606,8 +774,4 @@ class MarketDataExtractor:
         Information structure may vary by source but always
         includes core capabilities and limitations.
         """
-        if not isinstance(source, DataSource):
-            raise ValueError(f"Invalid source. Must be one of: {[s.value for s in DataSource]}")
-            
-        extractor = self._extractors[source]
-        return extractor.get_source_info()
\ No newline at end of file
+        return self._get_extractor(source).get_source_info()
\ No newline at end of file
@@ -3,12 +3,15 @@ Module for extracting macroeconomic data from the World Bank API.
 Implements multiple design patterns for robust and flexible data extraction.
 """
 
-import requests
 import pandas as pd
 import warnings
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Dict, List, Optional, Tuple
 from requests.exceptions import HTTPError
 
+from src.extractor._http import get_session
+
 class WorldBankExtractor:
     """
     A robust World Bank data extractor implementing several design patterns.
@@ -31,6 +34,10 @@ class WorldBankExtractor:
         "per_page": 25000
     }
 
+    # The API serves one (indicator, country) pair per request; they are
+    # fetched concurrently over the pooled session
+    MAX_WORKERS = 16
+
     EU_ALTERNATIVES = ["EUU", "EU27_2020", "EU28"]
     DEFAULT_COUNTRIES = ["ESP", "EUU"]
 
@@ -56,13 +63,17 @@ class WorldBankExtractor:
         "High-technology exports (% of manufactured exports)": ("TX.VAL.TECH.MF.ZS", None),
     }
 
+    # Name -> code catalog served by list_available_indicators, built once
+    _INDICATOR_CODES = {name: code for name, (code, _) in AVAILABLE_INDICATORS.items()}
+
     @classmethod
     def get_macro_data(
         cls,
         indicators: List[str],
         countries: List[str],
         start_date: str,
-        end_date: str
+        end_date: str,
+        failures: Optional[List[Tuple[str, str]]] = None
     ) -> pd.DataFrame:
         """
         Retrieve macroeconomic data from the World Bank API using multiple strategies.
@@ -81,6 +92,10 @@ class WorldBankExtractor:
             Start date in 'YYYY-MM-DD' format
         end_date : str
             End date in 'YYYY-MM-DD' format
+        failures : List[Tuple[str, str]], optional
+            If given, every (indicator, country) pair whose requests hit an
+            HTTP error is appended to it, so callers can tell a degraded
+            panel from a complete one
             
         Returns
         -------
@@ -97,14 +112,31 @@ class WorldBankExtractor:
         start_year = int(start_date[:4])
         end_year = int(end_date[:4])
 
-        data_frames = {}
+        selected = []
         for indicator in indicators:
             if indicator not in cls.AVAILABLE_INDICATORS:
                 warnings.warn(f"Unsupported indicator: {indicator}")
                 continue
+            selected.append(indicator)
+
+        # Every (indicator, country) request is issued up front; the pool
+        # returns the results in task order
+        tasks = [
+            (cls.AVAILABLE_INDICATORS[indicator][0], country)
+            for indicator, country in product(selected, countries)
+        ]
+        results = cls._fetch_many(tasks, start_year, end_year)
 
+        data_frames = {}
+        for i, indicator in enumerate(selected):
             code, transform = cls.AVAILABLE_INDICATORS[indicator]
-            df = cls._fetch_indicator(code, countries, start_year, end_year)
+            chunk = results[i * len(countries):(i + 1) * len(countries)]
+            if failures is not None:
+                failures.extend(
+                    (indicator, country)
+                    for country, (_, _, failed) in zip(countries, chunk) if failed
+                )
+            df = cls._build_indicator_frame(code, countries, chunk)
 
             # Strategy Pattern — apply transformation if defined
             if transform is not None:
@@ -152,46 +184,154 @@ class WorldBankExtractor:
         - **Factory:** Builds country-specific DataFrames.
         - **Observer:** Handles extraction progress and warnings.
         """
+        results = cls._fetch_many(
+            [(indicator_code, country) for country in countries],
+            start_year,
+            end_year
+        )
+        return cls._build_indicator_frame(indicator_code, countries, results)
+
+    @classmethod
+    def _fetch_many(
+        cls,
+        tasks: List[Tuple[str, str]],
+        start_year: int,
+        end_year: int
+    ) -> List[Tuple[Optional[pd.Series], List[tuple], bool]]:
+        """
+        Retrieve several (indicator, country) pairs concurrently.
+        
+        Parameters
+        ----------
+        tasks : List[Tuple[str, str]]
+            Pairs of World Bank indicator code and ISO country code
+        start_year : int
+            Starting year for extraction
+        end_year : int
+            Ending year for extraction
+            
+        Returns
+        -------
+        List[Tuple[Optional[pd.Series], List[tuple], bool]]
+            Result of ``_fetch_country`` for each task, in task order
+        """
+        if len(tasks) <= 1:
+            return [
+                cls._fetch_country(code, country, start_year, end_year)
+                for code, country in tasks
+            ]
+
+        with ThreadPoolExecutor(max_workers=min(cls.MAX_WORKERS, len(tasks))) as executor:
+            return list(executor.map(
+                lambda task: cls._fetch_country(task[0], task[1], start_year, end_year),
+                tasks
+            ))
+
+    @classmethod
+    def _fetch_country(
+        cls,
+        indicator_code: str,
+        country: str,
+        start_year: int,
+        end_year: int
+    ) -> Tuple[Optional[pd.Series], List[tuple], bool]:
+        """
+        Retrieve an indicator for one country, falling back to alternative
+        codes for the EU aggregate and to one year less on HTTP errors.
+        
+        Parameters
+        ----------
+        indicator_code : str
+            World Bank indicator code.
+        country : str
+            ISO country code.
+        start_year : int
+            Initial year.
+        end_year : int
+            Final year.
+            
+        Returns
+        -------
+        Tuple[Optional[pd.Series], List[tuple], bool]
+            The first non-empty series found (None if there is none), the
+            (country, start_year, end_year) requests that were tried, and
+            whether any of them failed with an HTTP error.
+        
+        Design Patterns
+        ----------------
+        - **Chain of Responsibility:** Provides fallback mechanisms for EU data.
+        """
+        tried = []
+        failed = False
+        alternatives = cls.EU_ALTERNATIVES if country == "EUU" else [country]
+
+        for alt_country in alternatives:
+            tried.append((alt_country, start_year, end_year))
+            try:
+                series = cls._fetch_indicator_country(
+                    indicator_code,
+                    alt_country,
+                    start_year,
+                    end_year
+                )
+                if not series.empty:
+                    return series, tried, failed
+
+            except HTTPError:
+                failed = True
+                if end_year > start_year:
+                    try:
+                        series = cls._fetch_indicator_country(
+                            indicator_code,
+                            alt_country,
+                            start_year,
+                            end_year - 1
+                        )
+                        if not series.empty:
+                            return series, tried, failed
+                    except HTTPError:
+                        continue
+
+        return None, tried, failed
+
+    @staticmethod
+    def _build_indicator_frame(
+        indicator_code: str,
+        countries: List[str],
+        results: List[Tuple[Optional[pd.Series], List[tuple], bool]]
+    ) -> pd.DataFrame:
+        """
+        Combine the per-country results of one indicator into a DataFrame.
+        
+        Warnings are issued here, on the calling thread, in country order.
+        
+        Parameters
+        ----------
+        indicator_code : str
+            World Bank indicator code.
+        countries : List[str]
+            ISO country codes, aligned with ``results``.
+        results : List[Tuple[Optional[pd.Series], List[tuple], bool]]
+            Output of ``_fetch_country`` for each country.
+            
+        Returns
+        -------
+        pd.DataFrame
+            A DataFrame containing the indicator data by country.
+            
+        Raises
+        ------
+        ValueError
+            If no country returned data.
+        """
         cols = {}
-        for country in countries:
-            tried = []
-            alternatives = cls.EU_ALTERNATIVES if country == "EUU" else [country]
-            success = False
-
-            for alt_country in alternatives:
-                tried.append((alt_country, start_year, end_year))
-                try:
-                    series = cls._fetch_indicator_country(
-                        indicator_code,
-                        alt_country,
-                        start_year,
-                        end_year
-                    )
-                    if not series.empty:
-                        cols[country] = series
-                        success = True
-                        break
-
-                except HTTPError:
-                    if end_year > start_year:
-                        try:
-                            series = cls._fetch_indicator_country(
-                                indicator_code,
-                                alt_country,
-                                start_year,
-                                end_year - 1
-                            )
-                            if not series.empty:
-                                cols[country] = series
-                                success = True
-                                break
-                        except HTTPError:
-                            continue
-
-            if not success:
+        for country, (series, tried, _) in zip(countries, results):
+            if series is None:
                 warnings.warn(
                     f"No data available for {indicator_code} in {country}. Tried: {tried}"
                 )
+            else:
+                cols[country] = series
 
         if not cols:
             raise ValueError(f"No data retrieved for {indicator_code} in {countries}")
@@ -231,28 +371,29 @@ class WorldBankExtractor:
         params = cls.DEFAULT_PARAMS.copy()
         params["date"] = f"{start_year}:{end_year}"
 
-        response = requests.get(url, params=params, timeout=60)
+        response = get_session().get(url, params=params, timeout=60)
         response.raise_for_status()
         data = response.json()
 
         if not isinstance(data, list) or len(data) < 2 or data[1] is None:
             return pd.Series(dtype=float)
 
-        rows = []
-        for record in data[1]:
-            try:
-                year = int(record.get("date"))
-                value = record.get("value")
-                if value is not None:
-                    rows.append((year, float(value)))
-            except (ValueError, TypeError):
-                continue
+        # Parse the records column-wise; entries without a numeric year or
+        # value are dropped, and a repeated year keeps its last value
+        records = pd.DataFrame.from_records(data[1], columns=["date", "value"])
+        years = pd.to_numeric(records["date"], errors="coerce")
+        values = pd.to_numeric(records["value"], errors="coerce")
+        valid = years.notna() & values.notna() & (years % 1 == 0)
 
-        if not rows:
+        if not valid.any():
             return pd.Series(dtype=float)
 
-        series = pd.Series(dict(rows)).sort_index()
-        return series
+        series = pd.Series(
+            values[valid].to_numpy(dtype=float),
+            index=years[valid].to_numpy(dtype="int64")
+        )
+        series = series[~series.index.duplicated(keep="last")]
+        return series.sort_index()
 
     @staticmethod
     def format_macro_data(indicator_frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -317,4 +458,4 @@ class WorldBankExtractor:
         - **Singleton:** Ensures consistent indicator catalog.
         - **Factory:** Builds a dictionary structure dynamically.
         """
-        return {k: v[0] for k, v in cls.AVAILABLE_INDICATORS.items()}
+        return dict(cls._INDICATOR_CODES)
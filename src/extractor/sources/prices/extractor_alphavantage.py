@@ -5,9 +5,9 @@ Implements multiple design patterns for robust and flexible data extraction.
 
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Union
-import requests
 import pandas as pd
 from decouple import config
+from src.extractor._http import get_session
 from src.extractor.sources.prices.extractor_prices_base import (
     BaseExtractor,
     Interval
@@ -33,6 +33,8 @@ class AlphaVantageExtractor(BaseExtractor):
     ----------
     INTERVAL_MAP : dict
         Mapping between internal interval enum and Alpha Vantage intervals
+    COLUMN_DTYPES : dict
+        Target dtype of each price column parsed from the API response
         
     Notes
     -----
@@ -52,6 +54,14 @@ class AlphaVantageExtractor(BaseExtractor):
         Interval.MONTHLY: "monthly"
     }
     
+    COLUMN_DTYPES = {
+        'Open': 'float64',
+        'High': 'float64',
+        'Low': 'float64',
+        'Close': 'float64',
+        'Volume': 'int64'
+    }
+    
     def __init__(
         self,
         symbols: Union[str, List[str]] = None,
@@ -175,39 +185,41 @@ class AlphaVantageExtractor(BaseExtractor):
             else:
                 function = "TIME_SERIES_INTRADAY"
             
-            # Fetch data for each symbol
-            data = pd.DataFrame()
-            for symbol in symbols:
+            def fetch(symbol: str) -> pd.DataFrame:
                 try:
                     url = f'https://www.alphavantage.co/query?function={function}&symbol={symbol}&apikey={self._api_key}'
-                    response = requests.get(url)   
+                    response = get_session().get(url)   
                     json_data = response.json()
-                    print(json_data)                 
                     ts_data = json_data['Time Series (Daily)']
 
                     df = pd.DataFrame.from_dict(ts_data, orient='index')
                     
                     df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
 
-                    for col in df.columns:
-                        df[col] = pd.to_numeric(df[col], errors='coerce')
+                    # The API returns every value as a string; cast all
+                    # columns in one call
+                    df = df.astype(self.COLUMN_DTYPES)
                     
                     # Set index and filter date range
-                    df.index = pd.to_datetime(df.index)
+                    df.index = pd.to_datetime(df.index, format='%Y-%m-%d')
                     df = df.sort_index()
                     df = df.loc[start_date:end_date]
                     
                     df['Symbol'] = symbol
-                    data = pd.concat([data, df])
+                    return df
                     
                 except Exception as e:
                     raise ConnectionError(f"Failed to fetch data from Alpha Vantage: {str(e)}")
-                    continue
+
+            # Fetch data for each symbol and concatenate once; growing the
+            # frame per symbol copies it every time
+            frames = self.fetch_symbols(fetch, symbols)
+            data = pd.concat(frames) if frames else pd.DataFrame()
             
             if data.empty:
                 raise ValueError("No data retrieved for any of the provided symbols")
                 
-            self.save_raw_data(data, f"{'_'.join(symbols)}.csv")
+            self.save_raw_data(data, f"{'_'.join(symbols)}")
             data = self.format_extract_data(data)
             
             return data
@@ -252,9 +264,7 @@ class AlphaVantageExtractor(BaseExtractor):
         - Proper data types and handling of missing values
         """
         try:
-            formatted_data = data.copy()
-            formatted_data = formatted_data.pivot_table(
-                index=data.index,
+            formatted_data = data.pivot(
                 columns="Symbol",
                 values=["Open", "High", "Low", "Close", "Volume"]
             )
@@ -263,7 +273,7 @@ class AlphaVantageExtractor(BaseExtractor):
             formatted_data = formatted_data.sort_index(axis=1, level=[0, 1])
             
             symbols = formatted_data.columns.get_level_values(1).unique()
-            self.save_processed_data(formatted_data, f"{'_'.join(symbols)}_clean.csv")
+            self.save_processed_data(formatted_data, f"{'_'.join(symbols)}_clean")
             
             return formatted_data
             
@@ -4,8 +4,8 @@ Implements multiple design patterns for robust and flexible data extraction with
 """
 
 import logging
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Union
+from datetime import datetime
+from typing import Dict, List, Optional, Union
 import pandas as pd
 from decouple import config
 from eodhd import APIClient
@@ -130,8 +130,8 @@ class EODHDExtractor(BaseExtractor):
     def extract_data(
         self,
         symbols: Union[str, List[str]],
-        start_date: date = date.today() - timedelta(days=30),
-        end_date: date = date.today(),
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
         interval: Interval = Interval.DAILY
     ) -> pd.DataFrame:
         """
@@ -144,9 +144,9 @@ class EODHDExtractor(BaseExtractor):
         ----------
         symbols : Union[str, List[str]]
             Stock symbols to fetch (e.g., 'AAPL' or ['AAPL', 'GOOGL'])
-        start_date : date, optional
+        start_date : datetime, optional
             Initial date for data extraction (default: 30 days ago)
-        end_date : date, optional
+        end_date : datetime, optional
             Final date for data extraction (default: today)
         interval : Interval, optional
             Data sampling interval (default: DAILY)
@@ -186,6 +186,7 @@ class EODHDExtractor(BaseExtractor):
             if not symbols:
                 raise ValueError("At least one ticker must be provided")
 
+            start_date, end_date = self.resolve_dates(start_date, end_date)
             self.validate_dates(start_date, end_date)
 
             eodhd_interval = self.INTERVAL_MAP.get(
@@ -193,8 +194,7 @@ class EODHDExtractor(BaseExtractor):
                 interval
             )
             
-            data = pd.DataFrame()
-            for symbol in symbols:
+            def fetch(symbol: str) -> pd.DataFrame:
                 try:
                     prices = self._api_client.get_eod_historical_stock_market_data(
                         symbol=symbol,
@@ -204,15 +204,19 @@ class EODHDExtractor(BaseExtractor):
                     )
                     df = pd.DataFrame(prices)
                     df['symbol'] = symbol
-                    data = pd.concat([data, df], ignore_index=True)
+                    return df
                 except Exception as e:
                     logger.error(f"Failed to fetch data for {symbol}: {str(e)}")
-                    continue
+                    return pd.DataFrame()
+
+            # Concatenate once; growing the frame per symbol copies it every time
+            frames = self.fetch_symbols(fetch, symbols)
+            data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
             if data.empty:
                 raise ValueError("No data retrieved for any of the provided symbols")
                
-            self.save_raw_data(data, f"{'_'.join(symbols)}.csv")
+            self.save_raw_data(data, f"{'_'.join(symbols)}")
             data = self.format_extract_data(data)
             
             return data
@@ -266,14 +270,13 @@ class EODHDExtractor(BaseExtractor):
                 "symbol": "Symbol"
             })
 
-            data['Date'] = pd.to_datetime(data['Date'])
+            data['Date'] = pd.to_datetime(data['Date'], format='%Y-%m-%d')
             data.set_index('Date', inplace=True)
 
             if 'adjusted_close' in data.columns:
                 data.drop('adjusted_close', axis=1, inplace=True)
 
-            data = data.pivot_table(
-                index=data.index,
+            data = data.pivot(
                 columns="Symbol",
                 values=["Open", "High", "Low", "Close", "Volume"]
             )
@@ -283,7 +286,7 @@ class EODHDExtractor(BaseExtractor):
 
             symbols = data.columns.get_level_values(1).unique()
             formatted_data = data.copy()
-            self.save_processed_data(formatted_data, f"{'_'.join(symbols)}_clean.csv")
+            self.save_processed_data(formatted_data, f"{'_'.join(symbols)}_clean")
             
             return formatted_data
 
@@ -20,14 +20,13 @@ Key Features:
     - Error handling and validation
 """
 
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Union
-from urllib.request import urlopen
+from datetime import datetime
+from typing import Dict, List, Optional, Union
 from io import StringIO
-import certifi
 import pandas as pd
 from decouple import config
 
+from src.extractor._http import get_session
 from src.extractor.sources.prices.extractor_prices_base import (
     BaseExtractor,
     Interval
@@ -99,8 +98,8 @@ class FMPExtractor(BaseExtractor):
     def extract_data(
         self,
         symbols: Union[str, List[str]],
-        start_date: date = date.today() - timedelta(days=30),
-        end_date: date = date.today(),
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
         interval: str = "1day"
     ) -> pd.DataFrame:
         """
@@ -155,29 +154,34 @@ class FMPExtractor(BaseExtractor):
             if not symbols:
                 raise ValueError("At least one symbol must be provided")
                 
+            start_date, end_date = self.resolve_dates(start_date, end_date)
             self.validate_dates(start_date, end_date)
 
-            # Fetch data for each symbol
-            data = pd.DataFrame()
-            for symbol in symbols:
-                try:
-                    start_date = start_date.strftime('%Y-%m-%d')
-                    end_date = end_date.strftime('%Y-%m-%d')
+            # Format the range once; it is shared by every symbol's request
+            date_from = start_date.strftime('%Y-%m-%d')
+            date_to = end_date.strftime('%Y-%m-%d')
 
-                    url = (f"https://financialmodelingprep.com/stable/historical-price-eod/full?from={start_date}&to={end_date}&symbol={symbol}&apikey={self._api_key}")
-                    response = urlopen(url, cafile=certifi.where())
-                    json_data = response.read().decode("utf-8")
-                    prices = pd.read_json(StringIO(json_data))
+            def fetch(symbol: str) -> pd.DataFrame:
+                try:
+                    url = (f"https://financialmodelingprep.com/stable/historical-price-eod/full?from={date_from}&to={date_to}&symbol={symbol}&apikey={self._api_key}")
+                    response = get_session().get(url)
+                    response.raise_for_status()
+                    prices = pd.read_json(StringIO(response.text))
                     prices['symbol'] = symbol
-                    data = pd.concat([data, prices], ignore_index=True)
+                    return prices
                     
                 except Exception as e:
                     raise ConnectionError(f"Failed to fetch data from FMP: {str(e)}")
+
+            # Fetch data for each symbol and concatenate once; growing the
+            # frame per symbol copies it every time
+            frames = self.fetch_symbols(fetch, symbols)
+            data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
             
             if data.empty:
                 raise ValueError("No data retrieved for any of the provided symbols")
 
-            self.save_raw_data(data, f"{'_'.join(symbols)}.csv")    
+            self.save_raw_data(data, f"{'_'.join(symbols)}")    
             data = self.format_extract_data(data)
 
             return data
@@ -238,14 +242,13 @@ class FMPExtractor(BaseExtractor):
                 "symbol": "Symbol"
             })
             
-            data['Date'] = pd.to_datetime(data['Date'])
+            data['Date'] = pd.to_datetime(data['Date'], format='%Y-%m-%d')
             data.set_index('Date', inplace=True)
             
             cols_to_drop = ['change', 'changePercent', 'vwap', 'label', 'changeOverTime']
             data = data.drop([col for col in cols_to_drop if col in data.columns], axis=1)
             
-            data = data.pivot_table(
-                index=data.index,
+            data = data.pivot(
                 columns="Symbol",
                 values=["Open", "High", "Low", "Close", "Volume"]
             )
@@ -254,7 +257,7 @@ class FMPExtractor(BaseExtractor):
             data = data.sort_index(axis=1, level=[0, 1])
 
             symbols = data.columns.get_level_values(1).unique()
-            self.save_processed_data(data, f"{'_'.join(symbols)}_clean.csv")
+            self.save_processed_data(data, f"{'_'.join(symbols)}_clean")
             
             return data
             
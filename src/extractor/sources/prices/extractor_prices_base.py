@@ -25,17 +25,47 @@ Module Structure:
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Callable, Dict, List, Optional, Set, Union, Tuple, TypeVar
 from pathlib import Path
 import logging
+import os
 import pandas as pd
-from pathlib import Path
 
 # Configure logging for data extraction operations
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Storage locations are resolved once per process rather than per extractor
+BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent.parent
+RAW_DATA_DIR = BASE_DIR / "data" / "raw"
+PROCESSED_DATA_DIR = BASE_DIR / "data" / "processed"
+
+_created_dirs: Set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """
+    Create a directory on first use and remember that it exists.
+    
+    Parameters
+    ----------
+    path : Path
+        Directory to create, including missing parents
+        
+    Returns
+    -------
+    Path
+        The same directory
+    """
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+    return path
+
 class DataSource(Enum):
     """
     Enumeration of supported financial data sources.
@@ -154,6 +184,12 @@ class BaseExtractor(ABC):
         Default time interval for data extraction
     DEFAULT_SOURCE : DataSource
         Default data source if none specified
+    MAX_WORKERS : int
+        Upper bound on concurrent per-symbol requests
+    DEFAULT_LOOKBACK : timedelta
+        Period requested when extract_data gets no start date
+    STORAGE_FORMAT : str
+        File format for saved raw and processed data ("parquet" or "csv")
         
     Template Methods
     ---------------
@@ -177,12 +213,15 @@ class BaseExtractor(ABC):
     REQUIRED_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
     DEFAULT_INTERVAL = Interval.DAILY
     DEFAULT_SOURCE = DataSource.YAHOO
+    MAX_WORKERS = 8
+    DEFAULT_LOOKBACK = timedelta(days=30)
+    STORAGE_FORMAT = "parquet"
     
     def __init__(
             self,
             symbols:Union[str, List[str]],
-            start_date:datetime = datetime.now() - timedelta(days=3650),
-            end_date:datetime = datetime.now(),
+            start_date:Optional[datetime] = None,
+            end_date:Optional[datetime] = None,
             source:DataSource = DEFAULT_SOURCE,
             interval:Interval = DEFAULT_INTERVAL
         ):
@@ -214,13 +253,15 @@ class BaseExtractor(ABC):
         
         Notes
         -----
-        - Automatically creates required directory structure
+        - Resolves the storage directories; they are created on first write
         - Validates basic parameters
         - Sets up logging configuration
         """
+        # Defaults are resolved per instance, not frozen at import time
+        now = datetime.now()
         self.symbols = symbols
-        self.start_date = start_date
-        self.end_date = end_date
+        self.start_date = start_date if start_date is not None else now - timedelta(days=3650)
+        self.end_date = end_date if end_date is not None else now
         self.source = source
         self.interval = interval
         self._setup_directories()
@@ -249,27 +290,22 @@ class BaseExtractor(ABC):
         
         Notes
         -----
-        - Creates directories if they don't exist
+        - Only assigns paths; directories are created when data is first
+          written to them (see ``_write_data``)
         - Organizes by data source and date
         - Maintains separation of raw and processed data
-        - Handles path resolution automatically
+        - Paths are resolved once at import time
         """
-        self.base_dir = Path(__file__).resolve().parent.parent.parent.parent.parent
-        
-        self.raw_data_dir = self.base_dir / "data" / "raw"
-        self.processed_data_dir = self.base_dir / "data" / "processed"
+        self.base_dir = BASE_DIR
         
-        self.raw_data_dir.mkdir(parents=True, exist_ok=True)
-        self.processed_data_dir.mkdir(parents=True, exist_ok=True)
+        self.raw_data_dir = RAW_DATA_DIR
+        self.processed_data_dir = PROCESSED_DATA_DIR
         
         if hasattr(self, 'source'):
             today = datetime.now().strftime('%Y-%m-%d')
             
             self.current_raw_dir = self.raw_data_dir / self.source.value / today
-            self.current_raw_dir.mkdir(parents=True, exist_ok=True)
-            
             self.current_processed_dir = self.processed_data_dir / self.source.value / today
-            self.current_processed_dir.mkdir(parents=True, exist_ok=True)
     
     @abstractmethod
     def extract_data(
@@ -341,6 +377,72 @@ class BaseExtractor(ABC):
         """
         pass
         
+    def fetch_symbols(
+        self,
+        fetch: Callable[[str], T],
+        symbols: List[str]
+    ) -> List[T]:
+        """
+        Run a per-symbol request for every symbol concurrently.
+        
+        Source APIs that only serve one symbol per call are I/O bound, so
+        the requests are issued from a thread pool instead of one after
+        another. Results keep the order of ``symbols``.
+        
+        Parameters
+        ----------
+        fetch : Callable[[str], T]
+            Function performing the request for a single symbol
+        symbols : List[str]
+            Symbols to request
+            
+        Returns
+        -------
+        List[T]
+            One result per symbol, in input order
+            
+        Raises
+        ------
+        Exception
+            The first exception raised by ``fetch``, in symbol order
+        """
+        if len(symbols) <= 1:
+            return [fetch(symbol) for symbol in symbols]
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(symbols))) as executor:
+            return list(executor.map(fetch, symbols))
+        
+    def resolve_dates(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[datetime, datetime]:
+        """
+        Fill in missing extraction dates at call time.
+        
+        Defaults written in a signature are evaluated once, when the module
+        is imported, so a long-running process would keep requesting the
+        range that was current at import. Extractors take None instead and
+        resolve it here on every call.
+        
+        Parameters
+        ----------
+        start_date : Optional[datetime]
+            Start of the range; defaults to DEFAULT_LOOKBACK before end_date
+        end_date : Optional[datetime]
+            End of the range; defaults to the current time
+            
+        Returns
+        -------
+        Tuple[datetime, datetime]
+            Resolved (start_date, end_date)
+        """
+        if end_date is None:
+            end_date = datetime.now()
+        if start_date is None:
+            start_date = end_date - self.DEFAULT_LOOKBACK
+        return start_date, end_date
+        
     def validate_dates(
         self,
         start_date: datetime,
@@ -392,9 +494,53 @@ class BaseExtractor(ABC):
         if end_date > datetime.now():
             raise ValueError("end_date cannot be in the future")
     
+    def _write_data(self, data: pd.DataFrame, file_path: Path) -> Path:
+        """
+        Write a data frame in the configured storage format.
+        
+        Parquet is columnar, typed and compressed, so it is much smaller and
+        faster to write and read back than CSV for numeric price data. When
+        pyarrow is not installed, or cannot encode the frame, it is written
+        as CSV instead. The Parquet file is written under a temporary name
+        and moved into place, so a failed encode leaves no partial file.
+        
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Data frame to write
+        file_path : Path
+            Target path without extension; the suffix of the format used is
+            appended to it
+            
+        Returns
+        -------
+        Path
+            Path of the written file
+        """
+        _ensure_dir(file_path.parent)
+        
+        if self.STORAGE_FORMAT == "parquet":
+            parquet_path = file_path.with_name(f"{file_path.name}.parquet")
+            tmp_path = file_path.with_name(f"{file_path.name}.parquet.tmp")
+            try:
+                data.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+                os.replace(tmp_path, parquet_path)
+                return parquet_path
+            # pyarrow's ArrowInvalid, ArrowTypeError and ArrowNotImplementedError
+            # derive from ValueError, TypeError and NotImplementedError
+            except (ImportError, ValueError, TypeError, NotImplementedError) as e:
+                logger.debug("Parquet unavailable for %s, saving as CSV: %s", file_path.name, e)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+        
+        csv_path = file_path.with_name(f"{file_path.name}.csv")
+        data.to_csv(csv_path)
+        return csv_path
+        
     def save_raw_data(self, data: pd.DataFrame, filename: str) -> None:
         """
-        Save raw data to CSV file in the source and date-specific directory.
+        Save raw data to a file in the source and date-specific directory.
         
         This method implements part of the Template Method pattern by providing
         a standard mechanism for persisting raw data. It ensures proper data
@@ -403,7 +549,7 @@ class BaseExtractor(ABC):
         Implementation Details:
         1. Verifies directory structure
         2. Constructs appropriate file path
-        3. Saves data in CSV format
+        3. Saves data in the configured storage format
         4. Handles potential errors
         
         Parameters
@@ -411,7 +557,7 @@ class BaseExtractor(ABC):
         data : pd.DataFrame
             Raw data frame to be saved
         filename : str
-            Name of the output file
+            Name of the output file, without extension
             
         Raises
         ------
@@ -437,15 +583,15 @@ class BaseExtractor(ABC):
             
             file_path = self.current_raw_dir / filename
             
-            print(f"Saving raw data to {file_path}")
-            data.to_csv(file_path)
+            file_path = self._write_data(data, file_path)
+            print(f"Saved raw data to {file_path}")
             
         except Exception as e:
             raise ValueError(f"Failed to save raw data to {filename}: {str(e)}") from e
         
     def save_processed_data(self, data: pd.DataFrame, filename: str) -> None:
         """
-        Save processed data to CSV file in the source and date-specific directory.
+        Save processed data to a file in the source and date-specific directory.
         
         This method is part of the Template Method pattern, providing standardized
         storage for processed (cleaned and transformed) data. It maintains data
@@ -462,7 +608,7 @@ class BaseExtractor(ABC):
         data : pd.DataFrame
             Processed and formatted data frame to save
         filename : str
-            Name of the output file
+            Name of the output file, without extension
             
         Raises
         ------
@@ -488,7 +634,7 @@ class BaseExtractor(ABC):
             
             file_path = self.current_processed_dir / filename
             
-            data.to_csv(file_path)
+            self._write_data(data, file_path)
             
         except Exception as e:
             raise ValueError(f"Failed to save processed data to {filename}: {str(e)}") from e
@@ -20,8 +20,8 @@ Key Features:
 """
 
 import yfinance as yf
-from datetime import date, datetime, timedelta
-from typing import Union, List, Dict
+from datetime import datetime
+from typing import Union, List, Dict, Optional
 import pandas as pd
 from src.extractor.sources.prices.extractor_prices_base import (
     BaseExtractor,
@@ -117,8 +117,8 @@ class YahooExtractor(BaseExtractor):
     def extract_data(
         self,
         symbols: Union[str, List[str]],
-        start_date: date = date.today() - timedelta(days=30),
-        end_date: date = date.today(),
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
         interval: str = "1d",
     ) -> pd.DataFrame:
         """
@@ -184,6 +184,7 @@ class YahooExtractor(BaseExtractor):
             if not symbols:
                 raise ValueError("At least one symbol must be provided")
             
+            start_date, end_date = self.resolve_dates(start_date, end_date)
             self.validate_dates(start_date, end_date)
 
             yf_interval = self.INTERVAL_MAP.get(
@@ -202,7 +203,7 @@ class YahooExtractor(BaseExtractor):
             if data.empty:
                 raise ValueError("No data retrieved for any of the provided symbols")
                
-            self.save_raw_data(data, f"{'_'.join(symbols)}.csv")
+            self.save_raw_data(data, f"{'_'.join(symbols)}")
             data = self.format_extract_data(data)
             
             return data
@@ -268,7 +269,7 @@ class YahooExtractor(BaseExtractor):
             
             symbols = raw_data.columns.get_level_values(1).unique()
             formatted_data = raw_data.copy()
-            self.save_processed_data(formatted_data, f"{'_'.join(symbols)}_clean.csv")
+            self.save_processed_data(formatted_data, f"{'_'.join(symbols)}_clean")
             
             return formatted_data
             
@@ -1,7 +1,10 @@
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection
 import seaborn as sns
 import numpy as np
 import pandas as pd
+from typing import Optional
 from src.analysis.entities.monte_carlo_metrics import MonteCarloCalculator
 
 class MonteCarloVisualizer:
@@ -18,7 +21,11 @@ class MonteCarloVisualizer:
         - Simulation: simulation number
     """
 
-    def __init__(self, simulations: pd.DataFrame):
+    def __init__(
+        self,
+        simulations: pd.DataFrame,
+        calculator: Optional[MonteCarloCalculator] = None
+    ):
         """Initialize MonteCarloVisualizer.
 
         Args:
@@ -26,6 +33,9 @@ class MonteCarloVisualizer:
                 simulation results. The DataFrame must contain the columns:
                 ['Date', 'Simulation', 'Asset', 'Weight', 'Value',
                 'Total Value', 'Return'].
+            calculator (MonteCarloCalculator, optional): Calculator already built
+                over the same simulations, so memoized metrics are shared with
+                the caller. A new one is created when omitted.
 
         Raises:
             ValueError: If the DataFrame is empty or missing required columns.
@@ -45,7 +55,9 @@ class MonteCarloVisualizer:
             )
 
         self.simulations = simulations.copy()
-        self.calculator = MonteCarloCalculator(simulations)
+        self.calculator = (
+            calculator if calculator is not None else MonteCarloCalculator(simulations)
+        )
 
     def plot_portfolio_value_evolution(self, title: str = "Portfolio Value Evolution") -> plt.Figure:
         """Plot the total portfolio value evolution for all simulations.
@@ -61,14 +73,18 @@ class MonteCarloVisualizer:
 
         # Group by Date and Simulation to get total portfolio values
         values_by_sim = (
-            self.simulations.groupby(["Date", "Simulation"])["Total Value"]
+            self.simulations.groupby(["Date", "Simulation"], observed=True)["Total Value"]
             .first()
             .unstack()
         )
 
-        # Plot all simulations
-        for sim in values_by_sim.columns:
-            ax.plot(values_by_sim.index, values_by_sim[sim], alpha=0.08, color="blue")
+        # Plot all simulations as a single collection (one artist, one draw call)
+        dates = mdates.date2num(values_by_sim.index.to_pydatetime())
+        paths = values_by_sim.to_numpy().T
+        segments = np.stack([np.broadcast_to(dates, paths.shape), paths], axis=-1)
+        ax.add_collection(LineCollection(segments, colors="blue", alpha=0.08))
+        ax.xaxis_date()
+        ax.autoscale_view()
 
         # Plot mean portfolio value
         mean_values = values_by_sim.mean(axis=1)
@@ -94,7 +110,7 @@ class MonteCarloVisualizer:
         sns.set_style("whitegrid")
 
         # Compute mean return per simulation
-        returns = self.simulations.groupby("Simulation")["Return"].mean()
+        returns = self.calculator.simulation_returns()
 
         # Plot histogram
         sns.histplot(data=returns, bins=30, kde=True, ax=ax)
@@ -120,7 +136,9 @@ class MonteCarloVisualizer:
         fig, ax = plt.subplots(figsize=(15, 7))
         sns.set_style("whitegrid")
 
-        pivot_df = self.simulations.pivot_table(index="Simulation", columns="Asset", values="Weight", aggfunc="sum")
+        pivot_df = self.simulations.pivot_table(
+            index="Simulation", columns="Asset", values="Weight", aggfunc="sum", observed=True
+        )
         pivot_df.plot.area(alpha=0.8)
 
         # Customize plot
@@ -320,9 +338,13 @@ class MonteCarloVisualizer:
         """
         fig, ax = plt.subplots(figsize=(12, 6))
 
-        # Plot all simulation paths
+        # Plot all simulation paths as a single collection
         if sims.ndim == 2:
-            ax.plot(sims, color="lightgray", alpha=0.3)
+            days = np.arange(sims.shape[0])
+            paths = sims.T
+            segments = np.stack([np.broadcast_to(days, paths.shape), paths], axis=-1)
+            ax.add_collection(LineCollection(segments, colors="lightgray", alpha=0.3))
+            ax.autoscale_view()
         else:
             ax.plot(sims, color="lightgray", alpha=0.7)
 
@@ -29,7 +29,7 @@ class MonteCarloReport(BaseReport):
         """Initialize MonteCarloReport.
 
         Args:
-            simulation (Union[MonteCarloRetorno, MonteCarloPortfolio, MonteCarloCombinado]):
+            simulation (Union[MonteCarloReturn, MonteCarloPortfolio, MonteCarloCombined]):
                 Monte Carlo simulation object already executed.
             title (str, optional): Report title. Defaults to "Monte Carlo Simulation Report".
             include_plots (bool, optional): Whether to include visualizations. Defaults to True.
@@ -45,7 +45,7 @@ class MonteCarloReport(BaseReport):
 
         self.simulation = simulation
         self.calculator = MonteCarloCalculator(simulation.simulations)
-        self.visualizer = MonteCarloVisualizer(simulation.simulations)
+        self.visualizer = MonteCarloVisualizer(simulation.simulations, calculator=self.calculator)
 
     def generate(self, auto_save: bool = True) -> Union[str, Path]:
         """Generate Monte Carlo simulation report and optionally save it.